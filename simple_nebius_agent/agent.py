@@ -4,9 +4,13 @@ Simple ADK agent that wraps Nebius Qwen3-30B API.
 This is a minimal example for local testing of A2A protocol integration.
 """
 
+from __future__ import annotations
+
 import os
-from google.adk.agents import LlmAgent
-from google.adk.models.lite_llm import LiteLlm
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from google.adk.agents import LlmAgent
 
 
 def create_agent() -> LlmAgent:
@@ -19,6 +23,11 @@ def create_agent() -> LlmAgent:
     Raises:
         ValueError: If NEBIUS_API_KEY is not set
     """
+    # Imported here: google.adk and litellm are slow to import, and only
+    # needed once the agent is actually built
+    from google.adk.agents import LlmAgent
+    from google.adk.models.lite_llm import LiteLlm
+
     nebius_key = os.getenv("NEBIUS_API_KEY")
     if not nebius_key:
         raise ValueError(
@@ -67,13 +76,26 @@ Always respond with either a tool call JSON or a helpful text message - never le
     return agent
 
 
-# Create the agent instance (used by ADK CLI)
-# ADK looks for 'root_agent' by default
-root_agent = create_agent()
-agent = root_agent  # Alias for backward compatibility
+def __getattr__(name: str) -> LlmAgent:
+    """
+    Build the agent on first access to `root_agent` (or its `agent` alias).
+
+    ADK looks for 'root_agent' by default; constructing it lazily keeps imports of
+    this module cheap and defers the NEBIUS_API_KEY check until the agent is used.
+    The instance is cached in module globals, so later lookups bypass this hook.
+    """
+    if name in ("root_agent", "agent"):
+        instance = globals().get("root_agent")
+        if instance is None:
+            instance = create_agent()
+        globals()["root_agent"] = globals()["agent"] = instance
+        return instance
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
 
 
 if __name__ == "__main__":
+    agent = create_agent()
     print("Simple Nebius Agent")
     print(f"Name: {agent.name}")
     print(f"Description: {agent.description}")
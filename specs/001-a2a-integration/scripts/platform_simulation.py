@@ -32,6 +32,7 @@ tau2_agent is model-agnostic - it handles both:
 
 Usage:
     python platform_simulation.py [--domain DOMAIN] [--num-tasks N]
+    python platform_simulation.py --job mock:2 --job airline:5 [--max-concurrent K]
 
 Environment Variables:
     NEBIUS_API_KEY - Required for both agents (Qwen model)
@@ -39,19 +40,42 @@ Environment Variables:
 
 import argparse
 import asyncio
+import contextlib
+import hashlib
+import io
+import itertools
 import json
 import os
 import sys
+import time
 import uuid
-from dataclasses import dataclass
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Any
 from dotenv import load_dotenv
 
 import httpx
+import orjson
 
 
 # Load .env file early so all fixtures and tests have access to env vars
 load_dotenv()
 
+DOMAINS = ["airline", "retail", "telecom", "mock"]
+
+# Wall-clock budget per requested task before an evaluation is abandoned
+PER_TASK_DEADLINE_S = 300
+
+# ADK server hosting both agents
+PLATFORM_BASE_URL = "http://localhost:8001"
+
+# On-disk cache of evaluator responses, keyed by request parameters
+CACHE_DIR = Path.home() / ".tau2_cache"
+
+
 # Colors for terminal output
 class Colors:
     RED = "\033[0;31m"
@@ -62,6 +86,62 @@ class Colors:
     NC = "\033[0m"  # No Color
 
 
+# Per-task output buffer; helpers write here and flush_logs() writes it to
+# stdout in one call at phase boundaries
+_OUTPUT: ContextVar[io.StringIO | None] = ContextVar("_OUTPUT", default=None)
+# True inside run_buffered(): output is held until the caller prints it
+_DEFERRED: ContextVar[bool] = ContextVar("_DEFERRED", default=False)
+
+
+def emit(text: str = ""):
+    """
+    Append a line to the current task's output buffer.
+    
+    Parameters:
+        text (str): Line to write; a trailing newline is added.
+    """
+    buf = _OUTPUT.get()
+    if buf is None:
+        buf = io.StringIO()
+        _OUTPUT.set(buf)
+    buf.write(text)
+    buf.write("\n")
+
+
+def flush_logs():
+    """
+    Write the current task's buffered output to stdout with a single write call.
+    
+    Does nothing inside run_buffered(), whose output is returned to the caller instead so concurrent jobs don't interleave.
+    """
+    buf = _OUTPUT.get()
+    if buf is None or _DEFERRED.get() or not buf.tell():
+        return
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+    buf.seek(0)
+    buf.truncate()
+
+
+async def run_buffered(coro) -> tuple[Any, str]:
+    """
+    Await `coro` with its own output buffer and return its result alongside the captured output.
+    
+    Meant to be wrapped in a task (e.g. via asyncio.gather) so the buffer is local to that task. If the coroutine raises, the exception is returned in place of its result so the output captured up to the failure is not lost.
+    
+    Returns:
+        tuple[Any, str]: The coroutine's result (or the exception it raised) and everything it emitted.
+    """
+    buf = io.StringIO()
+    _OUTPUT.set(buf)
+    _DEFERRED.set(True)
+    try:
+        result = await coro
+    except Exception as e:
+        result = e
+    return result, buf.getvalue()
+
+
 def print_header(title: str, color: str = Colors.BLUE):
     """
     Prints a colored, framed header block with the given title.
@@ -70,39 +150,39 @@ def print_header(title: str, color: str = Colors.BLUE):
         title (str): Text to display in the header.
         color (str): ANSI color code string used for the header frame and title (use values from Colors). Defaults to Colors.BLUE.
     """
-    print(f"\n{color}{'═' * 65}{Colors.NC}")
-    print(f"{color}  {title}{Colors.NC}")
-    print(f"{color}{'═' * 65}{Colors.NC}\n")
+    emit(f"\n{color}{'═' * 65}{Colors.NC}")
+    emit(f"{color}  {title}{Colors.NC}")
+    emit(f"{color}{'═' * 65}{Colors.NC}\n")
 
 
 def print_success(msg: str):
     """
-    Prints a green checkmark-styled success message to standard output.
+    Prints a green checkmark-styled success message to the output buffer.
     """
-    print(f"{Colors.GREEN}✓{Colors.NC} {msg}")
+    emit(f"{Colors.GREEN}✓{Colors.NC} {msg}")
 
 
 def print_error(msg: str):
     """
-    Prints an error message to stdout prefixed with a red cross symbol.
+    Prints an error message to the output buffer prefixed with a red cross symbol.
     
     Parameters:
         msg (str): The error text to display; printed in red with ANSI color reset after the message.
     """
-    print(f"{Colors.RED}✗{Colors.NC} {msg}")
+    emit(f"{Colors.RED}✗{Colors.NC} {msg}")
 
 
 def print_info(msg: str):
     """
-    Prints an informational message to stdout prefixed with a cyan arrow.
+    Prints an informational message to the output buffer prefixed with a cyan arrow.
     
     Parameters:
         msg (str): The message text to display.
     """
-    print(f"{Colors.CYAN}→{Colors.NC} {msg}")
+    emit(f"{Colors.CYAN}→{Colors.NC} {msg}")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class AgentRegistration:
     """Agent registration in the platform registry."""
 
@@ -110,7 +190,7 @@ class AgentRegistration:
     role: str  # "evaluator" or "evaluatee"
     endpoint: str
     model: str
-    capabilities: list[str]
+    capabilities: tuple[str, ...]
 
 
 class AgentRegistry:
@@ -123,17 +203,48 @@ class AgentRegistry:
         The registry stores agents in `self.agents`, a dictionary mapping agent name (str) to AgentRegistration.
         """
         self.agents: dict[str, AgentRegistration] = {}
+        # Secondary index so role lookups don't scan every registered agent
+        self._by_role: dict[str, list[AgentRegistration]] = defaultdict(list)
 
     def register(self, agent: AgentRegistration):
         """
         Register an agent in the registry and report the registration.
         
         Parameters:
-            agent (AgentRegistration): Agent metadata to store; if an agent with the same name exists it will be overwritten.
+            agent (AgentRegistration): Agent metadata to store; if an agent with the same name exists it will be overwritten. The role and capability strings are interned, since they repeat across agents.
         """
+        agent = replace(
+            agent,
+            role=sys.intern(agent.role),
+            capabilities=tuple(sys.intern(c) for c in agent.capabilities),
+        )
+        previous = self.agents.get(agent.name)
         self.agents[agent.name] = agent
+        if previous is None:
+            self._by_role[agent.role].append(agent)
+        elif previous.role == agent.role:
+            # Keep the agent's registration-order position within its role
+            role_agents = self._by_role[agent.role]
+            role_agents[role_agents.index(previous)] = agent
+        else:
+            self._by_role[previous.role].remove(previous)
+            self._by_role[agent.role] = [
+                a for a in self.agents.values() if a.role == agent.role
+            ]
         print_success(f"Registered agent: {agent.name} ({agent.role})")
 
+    def get_all(self, role: str) -> list[AgentRegistration]:
+        """
+        Get every registered agent with the given role, in registration order.
+        
+        Parameters:
+            role (str): Role to look up (e.g. "evaluator" or "evaluatee").
+        
+        Returns:
+            list[AgentRegistration]: Matching agents; empty if none are registered.
+        """
+        return list(self._by_role.get(role, ()))
+
     def get_evaluator(self) -> AgentRegistration | None:
         """
         Finds the first registered agent with role "evaluator".
@@ -141,10 +252,8 @@ class AgentRegistry:
         Returns:
             AgentRegistration or None: The first registered evaluator agent, or `None` if no evaluator is registered.
         """
-        for agent in self.agents.values():
-            if agent.role == "evaluator":
-                return agent
-        return None
+        evaluators = self._by_role.get("evaluator")
+        return evaluators[0] if evaluators else None
 
     def get_evaluatee(self) -> AgentRegistration | None:
         """
@@ -153,10 +262,8 @@ class AgentRegistry:
         Returns:
             AgentRegistration | None: The evaluatee agent if present, `None` otherwise.
         """
-        for agent in self.agents.values():
-            if agent.role == "evaluatee":
-                return agent
-        return None
+        evaluatees = self._by_role.get("evaluatee")
+        return evaluatees[0] if evaluatees else None
 
     def display(self):
         """
@@ -164,9 +271,9 @@ class AgentRegistry:
         
         Each registered agent is displayed as a formatted block containing the agent's name, role, model identifier, A2A endpoint, and a comma-separated list of capabilities. Intended for human-readable terminal output; does not return a value.
         """
-        print("\nRegistered Agents:")
+        emit("\nRegistered Agents:")
         for agent in self.agents.values():
-            print(f"""
+            emit(f"""
   ┌─────────────────────────────────────────────────────────────┐
   │  Agent: {agent.name:<52}│
   │  Role: {agent.role:<53}│
@@ -176,26 +283,87 @@ class AgentRegistry:
   └─────────────────────────────────────────────────────────────┘""")
 
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Request/message IDs: random once per process, then a cheap counter
+_ID_PREFIX = uuid.uuid4().hex
+_ID_COUNTER = itertools.count()
+
+# Shared HTTP client reused by every A2AClient so keepalive connections survive
+# across discovery/send calls and across simulations in the same process.
+_SHARED_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_shared_client(timeout: float = 600.0) -> httpx.AsyncClient:
+    """
+    Return the process-wide httpx.AsyncClient, creating it on first use.
+    
+    Parameters:
+        timeout (float): Read timeout in seconds applied when the client is first created; ignored afterwards. Connect, write and pool-acquire timeouts are kept short so a dead server or an exhausted pool fails fast.
+    
+    Returns:
+        httpx.AsyncClient: The shared client, configured with HTTP/2 (so concurrent requests to the same origin multiplex over one connection) and a large connection pool so concurrent evaluations are not capped by httpx's default limits.
+    """
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is None or _SHARED_CLIENT.is_closed:
+        _SHARED_CLIENT = httpx.AsyncClient(
+            timeout=httpx.Timeout(connect=5.0, read=timeout, write=30.0, pool=10.0),
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=2000,
+                max_keepalive_connections=1500,
+                keepalive_expiry=30,
+            ),
+        )
+    return _SHARED_CLIENT
+
+
+async def close_shared_client():
+    """
+    Close the process-wide httpx.AsyncClient, if one was created.
+    
+    Called once at shutdown; subsequent calls to get_shared_client() create a fresh client.
+    """
+    global _SHARED_CLIENT
+    if _SHARED_CLIENT is not None:
+        await _SHARED_CLIENT.aclose()
+        _SHARED_CLIENT = None
+
+
 class A2AClient:
     """Simple A2A client for platform communication."""
 
-    def __init__(self, timeout: float = 600.0):
+    def __init__(
+        self, timeout: float = 600.0, client: httpx.AsyncClient | None = None
+    ):
         """
-        Initialize the A2A client and its underlying HTTP client.
+        Initialize the A2A client on top of a pooled HTTP client.
         
         Parameters:
-            timeout (float): Request timeout in seconds for the internal HTTP client; defaults to 600.0. The value is applied to the created httpx.AsyncClient used for A2A requests.
+            timeout (float): Request timeout in seconds used if the shared client has not been created yet; defaults to 600.0.
+            client (httpx.AsyncClient | None): Optional injected client; when omitted, the process-wide shared client from get_shared_client() is used.
         """
         self.timeout = timeout
-        self.client = httpx.AsyncClient(timeout=timeout)
+        self.client = client if client is not None else get_shared_client(timeout)
 
     async def close(self):
         """
-        Close the underlying HTTP client and release associated network resources.
+        Release this A2A client.
         
-        Awaits the internal httpx.AsyncClient to finish and free its connections.
+        The underlying httpx.AsyncClient is shared (or owned by the caller that injected it), so this is a no-op; the shared pool is closed once via close_shared_client() at shutdown.
         """
-        await self.client.aclose()
+
+    async def prewarm(self, base_url: str) -> None:
+        """
+        Establish a pooled keepalive connection to `base_url` ahead of real requests.
+        
+        Sends a cheap HEAD request and ignores the outcome; failures are left for the real request to report.
+        
+        Parameters:
+            base_url (str): Origin to connect to (e.g., "http://localhost:8001").
+        """
+        with contextlib.suppress(Exception):
+            await self.client.head(base_url, timeout=5.0)
 
     async def discover_agent(self, base_url: str, agent_name: str) -> dict | None:
         """
@@ -213,7 +381,7 @@ class A2AClient:
         try:
             response = await self.client.get(url)
             if response.status_code == 200:
-                return response.json()
+                return orjson.loads(response.content)
         except Exception as e:
             print_error(f"Discovery failed: {e}")
         return None
@@ -232,29 +400,124 @@ class A2AClient:
         Returns:
         	response (dict): Parsed JSON response from the endpoint.
         """
-        request_id = str(uuid.uuid4())
-        message_id = str(uuid.uuid4())
-
-        payload = {
-            "jsonrpc": "2.0",
-            "id": request_id,
-            "method": "message/send",
-            "params": {
-                "message": {
-                    "messageId": message_id,
-                    "role": "user",
-                    "parts": [{"text": message}],
+        if context_id:
+            body = orjson.dumps(_build_payload("message/send", message, context_id))
+        else:
+            body = _encode_send_payload(message)
+
+        response = await self.client.post(endpoint, content=body, headers=_JSON_HEADERS)
+        return orjson.loads(response.content)
+
+    async def stream_message(
+        self, endpoint: str, message: str, context_id: str | None = None
+    ) -> AsyncIterator[dict]:
+        """
+        Send a JSON-RPC 2.0 A2A `message/stream` request and yield each event as it arrives.
+        
+        Parameters:
+        	endpoint (str): URL of the agent A2A endpoint to POST the message to.
+        	message (str): Text content to include as the single message part.
+        	context_id (str | None): Optional context identifier to include on the message.
+        
+        Yields:
+        	event (dict): Parsed JSON-RPC response for each server-sent event. If the server answers with a plain JSON body instead of an event stream, that body is yielded once; a non-2xx status is yielded once as an `{"error": ...}` event.
+        """
+        payload = _build_payload("message/stream", message, context_id)
+
+        async with self.client.stream(
+            "POST",
+            endpoint,
+            content=orjson.dumps(payload),
+            headers={**_JSON_HEADERS, "Accept": "text/event-stream"},
+        ) as response:
+            if response.is_error:
+                # Error pages are often HTML or plain text, so don't parse them
+                body = (await response.aread()).decode(errors="replace")
+                yield {
+                    "error": {
+                        "code": response.status_code,
+                        "message": f"HTTP {response.status_code}: {body[:200]}",
+                    }
                 }
-            },
-        }
+                return
+            if not response.headers.get("content-type", "").startswith(
+                "text/event-stream"
+            ):
+                yield orjson.loads(await response.aread())
+                return
+            async for line in response.aiter_lines():
+                if line.startswith("data:"):
+                    yield orjson.loads(line[5:])
+
+
+def _next_id() -> str:
+    """
+    Return a process-unique identifier for JSON-RPC requests and messages.
+    
+    IDs combine a random per-process prefix with a monotonically increasing counter, which is unique enough for JSON-RPC without drawing fresh randomness on every request.
+    """
+    return f"{_ID_PREFIX}-{next(_ID_COUNTER)}"
 
-        if context_id:
-            payload["params"]["message"]["contextId"] = context_id
 
-        response = await self.client.post(
-            endpoint, json=payload, headers={"Content-Type": "application/json"}
+def _build_payload(method: str, message: str, context_id: str | None) -> dict:
+    """
+    Build a JSON-RPC 2.0 request carrying a single user text message.
+    
+    Parameters:
+        method (str): JSON-RPC method, e.g. "message/send" or "message/stream".
+        message (str): Text content of the message part.
+        context_id (str | None): Optional context identifier to include on the message.
+    
+    Returns:
+        dict: The request payload.
+    """
+    message_payload = {
+        "messageId": _next_id(),
+        "role": "user",
+        "parts": [{"text": message}],
+    }
+    if context_id:
+        message_payload["contextId"] = context_id
+
+    return {
+        "jsonrpc": "2.0",
+        "method": method,
+        "id": _next_id(),
+        "params": {"message": message_payload},
+    }
+
+
+# Fixed skeleton of a context-free message/send request; only the ids and text vary
+_SEND_PREFIX = b'{"jsonrpc":"2.0","method":"message/send","id":"'
+_SEND_MESSAGE_ID = b'","params":{"message":{"messageId":"'
+_SEND_PARTS = b'","role":"user","parts":[{"text":'
+_SEND_SUFFIX = b"}]}}}"
+
+
+def _encode_send_payload(message: str) -> bytes:
+    """
+    Serialize a context-free "message/send" request by filling the pre-built byte template.
+    
+    Produces the same JSON as `orjson.dumps(_build_payload("message/send", message, None))` without building the intermediate dicts; only the text is escaped via orjson.
+    
+    Parameters:
+        message (str): Text content of the message part.
+    
+    Returns:
+        bytes: The encoded request body.
+    """
+    message_id = _next_id()
+    return b"".join(
+        (
+            _SEND_PREFIX,
+            _next_id().encode(),
+            _SEND_MESSAGE_ID,
+            message_id.encode(),
+            _SEND_PARTS,
+            orjson.dumps(message),
+            _SEND_SUFFIX,
         )
-        return response.json()
+    )
 
 
 def extract_response_text(response: dict) -> str:
@@ -262,7 +525,8 @@ def extract_response_text(response: dict) -> str:
     Extract the first text artifact from an A2A response.
     
     Parameters:
-        response (dict): Parsed A2A JSON response potentially containing `"result" -> "artifacts"`,
+        response (dict): Parsed A2A JSON response potentially containing `"result" -> "artifacts"`
+            (or a single `"result" -> "artifact"` for streaming artifact-update events),
             where each artifact has `"parts"` entries with `"kind"` and `"text"` fields.
     
     Returns:
@@ -271,7 +535,9 @@ def extract_response_text(response: dict) -> str:
     """
     try:
         result = response.get("result", {})
-        artifacts = result.get("artifacts", [])
+        artifacts = result.get("artifacts") or (
+            [result["artifact"]] if "artifact" in result else []
+        )
 
         for artifact in artifacts:
             parts = artifact.get("parts", [])
@@ -283,18 +549,226 @@ def extract_response_text(response: dict) -> str:
     return ""
 
 
-async def run_platform_simulation(domain: str, num_tasks: int):
+def build_evaluation_message(evaluatee: AgentRegistration, domain: str, num_tasks: int) -> str:
+    """
+    Build the natural-language evaluation request sent to the evaluator.
+    
+    Parameters:
+        evaluatee (AgentRegistration): Agent to be evaluated.
+        domain (str): Evaluation domain to request.
+        num_tasks (int): Number of tasks to request.
+    
+    Returns:
+        str: Message instructing the evaluator to run the evaluation.
+    """
+    return f"""Please evaluate the agent at endpoint {evaluatee.endpoint} using the {domain} domain. Run the evaluation with {num_tasks} tasks and 1 trial per task. Use the run_tau2_evaluation tool to execute this evaluation."""
+
+
+def cache_key(
+    evaluator: AgentRegistration,
+    evaluatee: AgentRegistration,
+    domain: str,
+    num_tasks: int,
+) -> str:
     """
-    Simulate the platform workflow that registers agents, discovers them via A2A, requests an evaluation, and displays results.
+    Compute the response-cache key for an evaluation request.
     
-    This coroutine boots a mock agent evaluation platform: verifies required environment variables, registers an evaluator and an evaluatee in an AgentRegistry, discovers both agents using the A2A protocol, sends an evaluation request to the evaluator for the given domain and number of tasks, extracts and prints the evaluator's textual response (or error/raw output), and cleans up network resources.
+    Returns:
+        str: SHA-256 hex digest over the evaluator name, evaluatee endpoint and model, domain and task count.
+    """
+    key_data = {
+        "endpoint": evaluatee.endpoint,
+        "model": evaluatee.model,
+        "domain": domain,
+        "num_tasks": num_tasks,
+        "evaluator": evaluator.name,
+    }
+    return hashlib.sha256(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+
+def load_cached_response(key: str, ttl: float) -> dict | None:
+    """
+    Load a cached evaluator response if one exists and is younger than `ttl` seconds.
+    
+    Returns:
+        dict | None: The cached raw A2A response, or `None` on a miss, an expired entry, or an unreadable file.
+    """
+    cache_path = CACHE_DIR / f"{key}.json"
+    try:
+        if time.time() - cache_path.stat().st_mtime > ttl:
+            return None
+        return orjson.loads(cache_path.read_bytes())["raw"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def store_cached_response(key: str, response_text: str, response: dict):
+    """
+    Atomically write an evaluator response to the on-disk cache.
+    
+    The entry is written to a temporary file and moved into place with Path.replace so concurrent readers never see a partial file.
+    """
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    cache_path = CACHE_DIR / f"{key}.json"
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(
+        orjson.dumps({"response_text": response_text, "raw": response, "ts": time.time()})
+    )
+    tmp_path.replace(cache_path)
+
+
+async def run_one(
+    job: tuple[str, int],
+    client: A2AClient,
+    evaluator: AgentRegistration,
+    evaluatee: AgentRegistration,
+    cache_ttl: float | None = None,
+    stream: bool = True,
+) -> dict:
+    """
+    Send a single evaluation request to the evaluator and return its raw A2A response.
+    
+    Parameters:
+        job (tuple[str, int]): `(domain, num_tasks)` pair to evaluate.
+        client (A2AClient): Client used to talk to the evaluator.
+        evaluator (AgentRegistration): Agent that runs the evaluation.
+        evaluatee (AgentRegistration): Agent being evaluated.
+        cache_ttl (float | None): Maximum age in seconds of a reusable cached response; `None` disables the cache.
+        stream (bool): Use `message/stream` and report progress as events arrive; when False, block on `message/send`.
+    
+    Returns:
+        dict: Parsed JSON-RPC response from the evaluator (possibly served from the cache). Streamed runs return the final event with all received artifacts merged into `result.artifacts`.
+    """
+    domain, num_tasks = job
+    key = None
+    if cache_ttl is not None:
+        key = cache_key(evaluator, evaluatee, domain, num_tasks)
+        cached = load_cached_response(key, cache_ttl)
+        if cached is not None:
+            print_info(f"Cache hit for domain={domain}, num_tasks={num_tasks}")
+            return cached
+        print_info(f"Cache miss for domain={domain}, num_tasks={num_tasks}")
+
+    evaluation_message = build_evaluation_message(evaluatee, domain, num_tasks)
+    if stream:
+        request = collect_stream(
+            client.stream_message(evaluator.endpoint, evaluation_message), domain
+        )
+    else:
+        request = client.send_message(evaluator.endpoint, evaluation_message)
+
+    # Bound the whole evaluation so a hung evaluator can't hold a slot forever
+    deadline = num_tasks * PER_TASK_DEADLINE_S
+    try:
+        response = await asyncio.wait_for(request, timeout=deadline)
+    except (asyncio.TimeoutError, httpx.TimeoutException):
+        # httpx's own read timeout can fire before the deadline on long jobs
+        print_error(f"Evaluation of {domain} timed out after {deadline}s")
+        return {"error": {"message": f"Evaluation timed out after {deadline}s"}}
+    except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+        print_error(f"Evaluation of {domain} failed: {e}")
+        return {"error": {"message": f"Evaluation request failed: {e}"}}
+
+    # Only successful evaluations are worth reusing
+    response_text = extract_response_text(response)
+    if key is not None and response_text:
+        store_cached_response(key, response_text, response)
+    return response
+
+
+async def collect_stream(events: AsyncIterator[dict], label: str) -> dict:
+    """
+    Consume a `message/stream` event stream, printing progress and merging artifacts.
+    
+    Parameters:
+        events (AsyncIterator[dict]): JSON-RPC events from A2AClient.stream_message.
+        label (str): Job label shown in progress output.
+    
+    Returns:
+        dict: The last event received (or the first error event), with every artifact seen so far merged into `result.artifacts` so it can be handled like a `message/send` response.
+    """
+    response: dict = {}
+    artifacts: dict[str, dict] = {}
+    async for event in events:
+        response = event
+        if "error" in event:
+            break
+        result = event.get("result", {})
+        artifact = result.get("artifact")
+        if artifact is None:
+            for artifact in result.get("artifacts") or ():
+                artifacts[artifact.get("artifactId", str(len(artifacts)))] = artifact
+            continue
+        artifact_id = artifact.get("artifactId", str(len(artifacts)))
+        if result.get("append") and artifact_id in artifacts:
+            artifacts[artifact_id]["parts"].extend(artifact.get("parts", []))
+        else:
+            artifacts[artifact_id] = artifact
+        print_info(
+            f"[{label}] received artifact chunk "
+            f"({len(extract_response_text(event))} chars)"
+        )
+        flush_logs()
+
+    if artifacts and "error" not in response:
+        result = {**response.get("result", {}), "artifacts": list(artifacts.values())}
+        result.pop("artifact", None)
+        response = {**response, "result": result}
+    return response
+
+
+async def guarded(sem: asyncio.Semaphore, coro_fn, *args):
+    """
+    Await `coro_fn(*args)` while holding `sem`, bounding how many run at once.
+    """
+    async with sem:
+        return await coro_fn(*args)
+
+
+def display_result(response: dict | BaseException):
+    """
+    Print the evaluator's textual response, or the A2A error / raw payload when no text is present.
+    
+    Parameters:
+        response (dict | BaseException): Parsed JSON-RPC response from the evaluator, or the exception that ended the job.
+    """
+    if isinstance(response, BaseException):
+        print_error(f"Evaluation failed: {type(response).__name__}: {response}")
+        return
+
+    response_text = extract_response_text(response)
+
+    if response_text:
+        emit(f"tau2_agent response:\n")
+        emit(response_text)
+    else:
+        # Check for errors
+        if "error" in response:
+            print_error(f"A2A Error: {response['error']}")
+        else:
+            print_info("Raw response:")
+            emit(orjson.dumps(response, option=orjson.OPT_INDENT_2).decode())
+
+
+async def run_platform_simulation(
+    jobs: list[tuple[str, int]],
+    max_concurrent: int = 4,
+    cache_ttl: float | None = None,
+    stream: bool = True,
+):
+    """
+    Simulate the platform workflow that registers agents, discovers them via A2A, requests evaluations, and displays results.
+    
+    This coroutine boots a mock agent evaluation platform: verifies required environment variables, registers an evaluator and an evaluatee in an AgentRegistry, discovers both agents using the A2A protocol, sends one evaluation request per job to the evaluator (at most `max_concurrent` in flight, all sharing one A2AClient), extracts and prints each textual response (or error/raw output), and cleans up network resources.
     
     Parameters:
-        domain (str): Evaluation domain to request (e.g., "airline", "retail", "telecom", "mock").
-        num_tasks (int): Number of tasks to request the evaluator to run.
+        jobs (list[tuple[str, int]]): `(domain, num_tasks)` pairs to evaluate, e.g. `[("mock", 2), ("airline", 5)]`.
+        max_concurrent (int): Maximum number of evaluation requests in flight at once; defaults to 4.
+        cache_ttl (float | None): Reuse cached evaluator responses younger than this many seconds; `None` (default) always re-evaluates.
+        stream (bool): Consume evaluator output via A2A `message/stream` with progress reporting (default); when False, block on `message/send`.
     
     """
-    print(f"""
+    emit(f"""
 {Colors.CYAN}╔═══════════════════════════════════════════════════════════════╗
 ║                                                               ║
 ║              🏢 Agent Evaluation Platform                     ║
@@ -311,6 +785,12 @@ async def run_platform_simulation(domain: str, num_tasks: int):
         print_error("NEBIUS_API_KEY environment variable is not set")
         sys.exit(1)
     print_success("NEBIUS_API_KEY is set")
+    flush_logs()
+
+    # Open the pooled connection while the registry is being set up so the
+    # first discovery request doesn't pay connection setup
+    client = A2AClient()
+    prewarm_task = asyncio.create_task(client.prewarm(PLATFORM_BASE_URL))
 
     # Step 2: Initialize agent registry
     print_header("STEP 2: Initializing Agent Registry")
@@ -324,7 +804,7 @@ async def run_platform_simulation(domain: str, num_tasks: int):
             role="evaluator",
             endpoint="http://localhost:8001/a2a/tau2_agent",
             model="model-agnostic",
-            capabilities=["run_tau2_evaluation", "list_domains", "get_evaluation_results"],
+            capabilities=("run_tau2_evaluation", "list_domains", "get_evaluation_results"),
         )
     )
 
@@ -335,89 +815,156 @@ async def run_platform_simulation(domain: str, num_tasks: int):
             role="evaluatee",
             endpoint="http://localhost:8001/a2a/simple_nebius_agent",
             model="nebius/Qwen/Qwen3-30B-A3B-Thinking-2507",
-            capabilities=["conversational_agent"],
+            capabilities=("conversational_agent",),
         )
     )
 
     registry.display()
+    flush_logs()
 
     # Step 3: Discover agents via A2A
     print_header("STEP 3: Discovering Agents via A2A Protocol")
 
-    client = A2AClient()
-
     evaluator = registry.get_evaluator()
     evaluatee = registry.get_evaluatee()
 
-    evaluator_card = await client.discover_agent("http://localhost:8001", evaluator.name)
-    if evaluator_card:
-        print_success(f"Discovered {evaluator.name}: {evaluator_card.get('name')}")
-    else:
-        print_error(f"Failed to discover {evaluator.name}")
-        await client.close()
-        sys.exit(1)
+    # Discovery requests are independent, so run them concurrently
+    cards = await asyncio.gather(
+        client.discover_agent(PLATFORM_BASE_URL, evaluator.name),
+        client.discover_agent(PLATFORM_BASE_URL, evaluatee.name),
+        return_exceptions=True,
+    )
 
-    evaluatee_card = await client.discover_agent("http://localhost:8001", evaluatee.name)
-    if evaluatee_card:
-        print_success(f"Discovered {evaluatee.name}: {evaluatee_card.get('name')}")
-    else:
-        print_error(f"Failed to discover {evaluatee.name}")
-        await client.close()
-        sys.exit(1)
+    for agent, card in zip((evaluator, evaluatee), cards, strict=True):
+        if isinstance(card, Exception) or not card:
+            print_error(f"Failed to discover {agent.name}")
+            await client.close()
+            sys.exit(1)
+        print_success(f"Discovered {agent.name}: {card.get('name')}")
+    flush_logs()
 
-    # Step 4: Send evaluation request to tau2_agent
+    # Step 4: Send evaluation requests to tau2_agent
     print_header("STEP 4: Platform Sends Evaluation Request via A2A")
 
-    evaluation_message = f"""Please evaluate the agent at endpoint {evaluatee.endpoint} using the {domain} domain. Run the evaluation with {num_tasks} tasks and 1 trial per task. Use the run_tau2_evaluation tool to execute this evaluation."""
+    emit(f"Platform → tau2_agent (A2A JSON-RPC 2.0)")
+    for domain, num_tasks in jobs:
+        emit(f"\n  Message: {build_evaluation_message(evaluatee, domain, num_tasks)}")
+    emit()
 
-    print(f"Platform → tau2_agent (A2A JSON-RPC 2.0)")
-    print(f"\n  Message: {evaluation_message}")
-    print()
-
-    print_info("Sending evaluation request to tau2_agent...")
+    print_info(
+        f"Sending {len(jobs)} evaluation request(s) to tau2_agent "
+        f"(max {max_concurrent} concurrent)..."
+    )
     print_info("(tau2_agent will execute the evaluation - this may take several minutes)")
-    print()
-
-    response = await client.send_message(evaluator.endpoint, evaluation_message)
-
-    # Step 5: Display response from tau2_agent
+    emit()
+    flush_logs()
+
+    sem = asyncio.Semaphore(max_concurrent)
+    runs = [
+        guarded(sem, run_one, job, client, evaluator, evaluatee, cache_ttl, stream)
+        for job in jobs
+    ]
+    if len(runs) == 1:
+        # A single job can report progress live
+        try:
+            responses = [await runs[0]]
+        except Exception as e:
+            responses = [e]
+    else:
+        # Concurrent jobs buffer their own progress; print it in job order.
+        # A failing job must not discard the others' results.
+        outcomes = await asyncio.gather(
+            *(run_buffered(run) for run in runs), return_exceptions=True
+        )
+        outcomes = [
+            (outcome, "") if isinstance(outcome, BaseException) else outcome
+            for outcome in outcomes
+        ]
+        responses = [response for response, _ in outcomes]
+        for (domain, num_tasks), (_, output) in zip(jobs, outcomes, strict=True):
+            if output:
+                emit(f"[{domain}:{num_tasks}]")
+                emit(output.rstrip("\n"))
+        flush_logs()
+
+    # Step 5: Display responses from tau2_agent
     print_header("STEP 5: Evaluation Results from tau2_agent", Colors.GREEN)
 
-    response_text = extract_response_text(response)
-
-    if response_text:
-        print(f"tau2_agent response:\n")
-        print(response_text)
-    else:
-        # Check for errors
-        if "error" in response:
-            print_error(f"A2A Error: {response['error']}")
-        else:
-            print_info("Raw response:")
-            print(json.dumps(response, indent=2))
+    for (domain, num_tasks), response in zip(jobs, responses, strict=True):
+        if len(jobs) > 1:
+            print_info(f"Job: domain={domain}, num_tasks={num_tasks}")
+        display_result(response)
+        emit()
+    flush_logs()
 
     # Cleanup
+    await prewarm_task
     await client.close()
 
     print_header("Platform Summary", Colors.BLUE)
-    print(f"  Domain: {domain}")
-    print(f"  Tasks Requested: {num_tasks}")
-    print(f"  Evaluator: {evaluator.name}")
-    print(f"  Evaluatee: {evaluatee.name}")
-    print(f"  Protocol: A2A (JSON-RPC 2.0)")
-    print()
-    print(f"{Colors.GREEN}Platform simulation completed{Colors.NC}")
+    for domain, num_tasks in jobs:
+        emit(f"  Domain: {domain}")
+        emit(f"  Tasks Requested: {num_tasks}")
+    emit(f"  Evaluator: {evaluator.name}")
+    emit(f"  Evaluatee: {evaluatee.name}")
+    emit(f"  Protocol: A2A (JSON-RPC 2.0)")
+    emit()
+    emit(f"{Colors.GREEN}Platform simulation completed{Colors.NC}")
+    flush_logs()
+
+
+def parse_job(value: str) -> tuple[str, int]:
+    """
+    Parse a `DOMAIN:NUM_TASKS` command-line value into a job tuple.
+    
+    Parameters:
+        value (str): Job specification such as "airline:5".
+    
+    Returns:
+        tuple[str, int]: The `(domain, num_tasks)` pair.
+    
+    Raises:
+        argparse.ArgumentTypeError: If the value is malformed or the domain is unknown.
+    """
+    domain, sep, num_tasks = value.partition(":")
+    if not sep or domain not in DOMAINS or not num_tasks.isdigit() or int(num_tasks) < 1:
+        msg = f"invalid job {value!r}; expected DOMAIN:NUM_TASKS with DOMAIN in {DOMAINS} and NUM_TASKS >= 1"
+        raise argparse.ArgumentTypeError(msg)
+    return domain, int(num_tasks)
+
+
+def positive_int(value: str) -> int:
+    """
+    Parse a command-line value as an integer of at least 1.
+    
+    Parameters:
+        value (str): The raw argument.
+    
+    Returns:
+        int: The parsed value.
+    
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer or is less than 1.
+    """
+    if not value.isdigit() or int(value) < 1:
+        msg = f"expected an integer >= 1, got {value!r}"
+        raise argparse.ArgumentTypeError(msg)
+    return int(value)
 
 
 def main():
     """
     Parse command-line arguments for the simulation and execute the asynchronous platform workflow.
     
-    Accepts two flags:
+    Accepts the flags:
     - --domain: evaluation domain; one of "airline", "retail", "telecom", or "mock" (default: "mock").
     - --num-tasks: number of tasks to evaluate (integer, default: 2).
+    - --job: repeatable `DOMAIN:NUM_TASKS` job; when given, replaces --domain/--num-tasks.
+    - --max-concurrent: maximum evaluation requests in flight at once (default: 4).
+    - --cache-ttl: reuse cached responses younger than this many seconds (default: caching disabled).
+    - --no-stream: use blocking `message/send` instead of `message/stream`.
     
-    Starts the event loop and runs run_platform_simulation with the parsed arguments.
+    Starts the event loop and runs run_platform_simulation with the parsed jobs.
     """
     parser = argparse.ArgumentParser(
         description="Platform simulation for A2A-based agent evaluation"
@@ -425,19 +972,70 @@ def main():
     parser.add_argument(
         "--domain",
         default="mock",
-        choices=["airline", "retail", "telecom", "mock"],
+        choices=DOMAINS,
         help="Evaluation domain (default: mock)",
     )
     parser.add_argument(
         "--num-tasks",
-        type=int,
+        type=positive_int,
         default=2,
         help="Number of tasks to evaluate (default: 2)",
     )
+    parser.add_argument(
+        "--job",
+        dest="jobs",
+        action="append",
+        type=parse_job,
+        metavar="DOMAIN:NUM_TASKS",
+        help="Evaluation job to run; repeat to batch several jobs (overrides --domain/--num-tasks)",
+    )
+    parser.add_argument(
+        "--max-concurrent",
+        type=positive_int,
+        default=4,
+        help="Maximum number of evaluation requests in flight at once (default: 4)",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help=f"Reuse cached evaluator responses (stored in {CACHE_DIR}) younger than this many seconds (default: always re-evaluate)",
+    )
+    parser.add_argument(
+        "--no-stream",
+        action="store_true",
+        help="Block on message/send instead of streaming progress via message/stream",
+    )
 
     args = parser.parse_args()
+    jobs = args.jobs or [(args.domain, args.num_tasks)]
+
+    asyncio.run(
+        _run_and_shutdown(jobs, args.max_concurrent, args.cache_ttl, not args.no_stream)
+    )
+
 
-    asyncio.run(run_platform_simulation(args.domain, args.num_tasks))
+async def _run_and_shutdown(
+    jobs: list[tuple[str, int]],
+    max_concurrent: int,
+    cache_ttl: float | None,
+    stream: bool,
+):
+    """
+    Run the platform simulation and close the shared HTTP client afterwards.
+    
+    Parameters:
+        jobs (list[tuple[str, int]]): `(domain, num_tasks)` pairs to evaluate.
+        max_concurrent (int): Maximum number of evaluation requests in flight at once.
+        cache_ttl (float | None): Response-cache TTL in seconds, or `None` to disable caching.
+        stream (bool): Whether to use A2A `message/stream` for evaluation requests.
+    """
+    try:
+        await run_platform_simulation(jobs, max_concurrent, cache_ttl, stream)
+    finally:
+        flush_logs()
+        await close_shared_client()
 
 
 if __name__ == "__main__":
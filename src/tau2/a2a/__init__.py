@@ -8,7 +8,12 @@ from tau2.a2a.exceptions import (
     A2AMessageError,
     A2ATimeoutError,
 )
-from tau2.a2a.metrics import AggregatedMetrics, ProtocolMetrics, estimate_tokens
+from tau2.a2a.metrics import (
+    AggregatedMetrics,
+    ProtocolMetrics,
+    estimate_tokens,
+    estimate_tokens_bulk,
+)
 from tau2.a2a.models import A2AAgentState, A2AConfig, AgentCapabilities, AgentCard
 from tau2.a2a.translation import (
     a2a_to_tau2_assistant_message,
@@ -35,6 +40,7 @@ __all__ = [
     "ProtocolMetrics",
     "AggregatedMetrics",
     "estimate_tokens",
+    "estimate_tokens_bulk",
     # Translation
     "format_tools_as_text",
     "tau2_to_a2a_message_content",
@@ -1,11 +1,17 @@
 """A2A HTTP client for communicating with remote A2A agents."""
 
+import asyncio
 import contextlib
-import json
 import time
-import uuid
+import weakref
+from collections import deque
+from collections.abc import Iterable
+from secrets import token_hex
+from types import TracebackType
+from typing import Any
 
 import httpx
+import orjson
 from loguru import logger
 
 from tau2.a2a.exceptions import (
@@ -15,9 +21,131 @@ from tau2.a2a.exceptions import (
     A2AMessageError,
     A2ATimeoutError,
 )
-from tau2.a2a.metrics import ProtocolMetrics, estimate_tokens
+from tau2.a2a.metrics import (
+    AggregatedMetrics,
+    MetricRow,
+    MetricRowsView,
+    MetricTotals,
+    ProtocolMetrics,
+    estimate_tokens,
+)
 from tau2.a2a.models import A2AConfig, AgentCard
 
+# Parsed agent cards shared by all clients: endpoint -> (monotonic fetch time, card)
+_AGENT_CARD_CACHE: dict[str, tuple[float, AgentCard]] = {}
+
+# Per-loop, per-endpoint locks coalescing concurrent discoveries. asyncio locks
+# are bound to one event loop, so each loop gets its own table.
+_AGENT_CARD_LOCKS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, asyncio.Lock]
+] = weakref.WeakKeyDictionary()
+
+
+def _agent_card_lock(endpoint: str) -> asyncio.Lock:
+    """Return the discovery lock for an endpoint on the running loop."""
+    locks = _AGENT_CARD_LOCKS.setdefault(asyncio.get_running_loop(), {})
+    return locks.setdefault(endpoint, asyncio.Lock())
+
+
+# Chunk size for reading response bodies (see A2AClient._post)
+_READ_CHUNK_SIZE = 65536
+
+# Statuses meaning "overloaded, try again later", and the longest backoff
+_RETRY_STATUSES = frozenset({429, 503})
+_MAX_BACKOFF_S = 30.0
+
+
+def _retry_delay(retry_after: str | None, attempt: int) -> float:
+    """
+    Seconds to wait before retrying an overloaded request.
+
+    Honors a numeric ``Retry-After`` header; otherwise backs off
+    exponentially (1s, 2s, 4s, ...). Either way capped at 30 seconds.
+    """
+    if retry_after is not None:
+        try:
+            return min(_MAX_BACKOFF_S, max(0.0, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form; fall back to exponential backoff
+    return min(_MAX_BACKOFF_S, 2.0 ** (attempt - 1))
+
+
+def _preview(body: bytes | bytearray, limit: int) -> str:
+    """Decode the first ``limit`` bytes of a response body for logging."""
+    return bytes(body[:limit]).decode("utf-8", errors="replace")
+
+
+# A queued send_message_batched call: (caller's future, content, context_id)
+_PendingSend = tuple[asyncio.Future[tuple[str, str]], str, str | None]
+
+
+def _is_invalid_request(rpc_response: Any) -> bool:
+    """Return True if a JSON-RPC response is an "Invalid Request" (-32600) error."""
+    if not isinstance(rpc_response, dict):
+        return False
+    error = rpc_response.get("error")
+    return isinstance(error, dict) and error.get("code") == -32600
+
+
+def _text_parts(parts: Iterable[dict[str, Any]]) -> list[str]:
+    """Return the text of every part that carries one."""
+    return [part["text"] for part in parts if "text" in part]
+
+
+def _extract_response_texts(result: dict[str, Any]) -> list[str]:
+    """
+    Extract the response text parts from a JSON-RPC result.
+
+    The supported A2A response shapes are tried in priority order and the
+    first one that yields any text wins:
+
+    1. Google ADK style - ``result.artifacts[].parts``
+    2. Direct Message response - ``result.parts`` (per A2A spec)
+    3. TaskStatusUpdateEvent - ``result.status.message.parts`` (ADK streaming)
+    4. Legacy wrapper format - ``result.message.parts``
+    5. History-based - parts of the last agent message in ``result.history``
+
+    Args:
+        result: The ``result`` member of a JSON-RPC response
+
+    Returns:
+        List of text parts; empty if no shape yielded any text
+    """
+    artifacts = result.get("artifacts")
+    if artifacts:
+        texts = [
+            part["text"]
+            for artifact in artifacts
+            for part in artifact.get("parts", ())
+            if "text" in part
+        ]
+        if texts:
+            return texts
+
+    parts = result.get("parts")
+    if parts:
+        texts = _text_parts(parts)
+        if texts:
+            return texts
+
+    status = result.get("status")
+    if status:
+        texts = _text_parts(status.get("message", {}).get("parts", ()))
+        if texts:
+            return texts
+
+    message = result.get("message")
+    if message:
+        texts = _text_parts(message.get("parts", ()))
+        if texts:
+            return texts
+
+    for msg in reversed(result.get("history", ())):
+        if msg.get("role") == "agent":
+            return _text_parts(msg.get("parts", ()))
+
+    return []
+
 
 class A2AClient:
     """
@@ -27,6 +155,12 @@ class A2AClient:
     like authentication and error handling.
     """
 
+    # Fixed part of every message/send request; copied and filled per call
+    _RPC_TEMPLATE: dict[str, Any] = {
+        "jsonrpc": "2.0",
+        "method": "message/send",
+    }
+
     def __init__(
         self,
         config: A2AConfig,
@@ -43,43 +177,144 @@ class A2AClient:
         self._http_client = http_client
         self._agent_card: AgentCard | None = None
         self._owned_client = http_client is None
-        self._metrics: list[ProtocolMetrics] = []
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+        self._metrics: deque[MetricRow] = deque(maxlen=config.max_metrics)
+        self._metric_totals = MetricTotals()
+        # Caps in-flight requests; rebuilt per event loop like the client
+        self._concurrency: asyncio.Semaphore | None = None
+        self._concurrency_loop: asyncio.AbstractEventLoop | None = None
+        self._headers = self._build_headers()
+        # A2AConfig already stripped the trailing slash from the endpoint
+        self._post_url = config.endpoint
+        self._discovery_url = f"{config.endpoint}/.well-known/agent-card.json"
+        # Owned clients carry the headers as defaults; injected ones need
+        # them on every request
+        self._request_headers = None if self._owned_client else self._headers
+        # JSON-RPC batching state (see send_message_batched)
+        self._pending: asyncio.Queue[_PendingSend] | None = None
+        self._batch_task: asyncio.Task[None] | None = None
+        self._batch_loop: asyncio.AbstractEventLoop | None = None
+        self._inflight: set[asyncio.Task[None]] = set()
+        self._batch_supported: bool | None = None
+        self._next_rpc_id = 0
 
     def _create_http_client(self) -> httpx.AsyncClient:
         """
         Create a configured httpx.AsyncClient for performing HTTP requests.
         
         Returns:
-            httpx.AsyncClient: An AsyncClient configured with the client's timeout, SSL verification setting, default JSON headers, and redirects enabled.
+            httpx.AsyncClient: An AsyncClient configured with the client's timeout, SSL verification setting, default JSON headers, a keepalive connection pool, HTTP/2 unless disabled in the config (so concurrent requests multiplex over one connection), and redirects enabled.
         """
         return httpx.AsyncClient(
             timeout=httpx.Timeout(self.config.timeout),
+            http2=self.config.http2,
             verify=self.config.verify_ssl,
-            headers=self._build_headers(),
+            headers=self._headers,
             follow_redirects=True,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                # Agent turns are spaced out by user-simulator LLM calls;
+                # keep idle connections long enough to survive the gap
+                keepalive_expiry=300,
+            ),
         )
 
-    @contextlib.asynccontextmanager
-    async def _http_client_context(self):
+    async def _get_client(self) -> httpx.AsyncClient:
         """
-        Provide an async context manager that yields an httpx.AsyncClient.
+        Return the httpx.AsyncClient used for requests, creating it on first use.
         
-        Yields the externally supplied client when one was provided to the instance; otherwise creates a new AsyncClient for the context and ensures it is closed on exit. The caller remains responsible for managing the lifecycle of an external client.
+        An externally supplied client is always returned as-is (the caller manages its lifecycle). Otherwise a single long-lived client is created and reused so connections stay pooled across requests. Because httpx connections are bound to the event loop that opened them, the owned client is closed and rebuilt when called from a different loop (e.g. successive `asyncio.run` calls).
         """
-        if self._http_client is not None:
-            # External client provided - reuse it (caller manages lifecycle)
-            yield self._http_client
-        else:
-            # Create fresh client for this request
-            async with self._create_http_client() as client:
-                yield client
+        if not self._owned_client:
+            assert self._http_client is not None
+            return self._http_client
+
+        loop = asyncio.get_running_loop()
+        if self._http_client is None or self._client_loop is not loop:
+            if self._http_client is not None:
+                await self._close_owned_client()
+            self._http_client = self._create_http_client()
+            self._client_loop = loop
+        return self._http_client
+
+    async def _close_owned_client(self) -> None:
+        """
+        Close the owned client, tolerating connections left on a closed loop.
+
+        Connections opened on an event loop that has since been closed can't
+        be shut down from another loop; their sockets are released when the
+        client is garbage collected.
+        """
+        client = self._http_client
+        self._http_client = None
+        self._client_loop = None
+        if client is None:
+            return
+        try:
+            await client.aclose()
+        except RuntimeError as e:
+            logger.debug("Closed A2A client from a stale event loop", error=str(e))
+
+    def _get_concurrency(self) -> asyncio.Semaphore:
+        """Return the in-flight request semaphore for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._concurrency is None or self._concurrency_loop is not loop:
+            self._concurrency = asyncio.Semaphore(self.config.max_inflight)
+            self._concurrency_loop = loop
+        return self._concurrency
+
+    async def _post(
+        self, client: httpx.AsyncClient, content: bytes
+    ) -> tuple[int, bytearray, int]:
+        """
+        POST a JSON-RPC body and read the response in fixed-size chunks.
+
+        The body is accumulated straight into one buffer that orjson parses
+        in place, instead of letting httpx join the chunks into a second
+        full-size copy first.
 
-    def _get_url(self, path: str = "") -> str:
-        """Build full URL from endpoint and path, ensuring no trailing slash issues."""
-        endpoint = self.config.endpoint.rstrip("/")
-        if path:
-            return f"{endpoint}/{path.lstrip('/')}"
-        return endpoint
+        At most ``config.max_inflight`` requests are on the wire at once.
+        A 429 or 503 is retried up to ``config.max_retries`` times, waiting
+        for the server's ``Retry-After`` or an exponential backoff; the
+        semaphore is released while waiting.
+
+        Args:
+            client: HTTP client to send the request with
+            content: Encoded request body
+
+        Returns:
+            Tuple of (status_code, response_body, attempts)
+        """
+        concurrency = self._get_concurrency()
+        attempt = 0
+        while True:
+            attempt += 1
+            async with concurrency, client.stream(
+                "POST",
+                self._post_url,
+                content=content,
+                headers=self._request_headers,
+            ) as response:
+                body = bytearray()
+                async for chunk in response.aiter_bytes(_READ_CHUNK_SIZE):
+                    body += chunk
+            status_code = response.status_code
+            if (
+                status_code not in _RETRY_STATUSES
+                or attempt > self.config.max_retries
+            ):
+                return status_code, body, attempt
+
+            delay = _retry_delay(response.headers.get("Retry-After"), attempt)
+            logger.warning(
+                "A2A agent overloaded, retrying",
+                endpoint=self.config.endpoint,
+                status_code=status_code,
+                attempt=attempt,
+                delay_s=delay,
+            )
+            await asyncio.sleep(delay)
 
     def _build_headers(self) -> dict[str, str]:
         """
@@ -103,7 +338,11 @@ class A2AClient:
         """
         Discover A2A agent capabilities via agent card.
 
-        Fetches /.well-known/agent-card.json and caches the result.
+        Fetches /.well-known/agent-card.json and caches the result, both on
+        this instance and process-wide (keyed by endpoint, for
+        ``config.agent_card_ttl_s`` seconds) so new clients for the same agent
+        skip the fetch. Concurrent discoveries of one endpoint share a single
+        fetch.
 
         Returns:
             AgentCard with agent metadata and capabilities
@@ -115,18 +354,58 @@ class A2AClient:
         if self._agent_card is not None:
             return self._agent_card
 
+        endpoint = self.config.endpoint
+        agent_card = self._get_cached_agent_card()
+        if agent_card is None:
+            async with _agent_card_lock(endpoint):
+                # Another client may have fetched it while we waited
+                agent_card = self._get_cached_agent_card()
+                if agent_card is None:
+                    agent_card = await self._fetch_agent_card()
+                    _AGENT_CARD_CACHE[endpoint] = (time.monotonic(), agent_card)
+
+        self._agent_card = agent_card
+        return agent_card
+
+    def _get_cached_agent_card(self) -> AgentCard | None:
+        """Return the process-wide cached agent card if it is still fresh."""
+        cached = _AGENT_CARD_CACHE.get(self.config.endpoint)
+        if cached is None:
+            return None
+        fetched_at, agent_card = cached
+        if time.monotonic() - fetched_at >= self.config.agent_card_ttl_s:
+            return None
+        return agent_card
+
+    @staticmethod
+    def invalidate_agent_card(endpoint: str | None = None) -> None:
+        """
+        Drop process-wide cached agent cards.
+
+        Clients that already discovered the agent keep their own copy.
+
+        Args:
+            endpoint: Agent endpoint to invalidate; None clears every entry
+        """
+        if endpoint is None:
+            _AGENT_CARD_CACHE.clear()
+        else:
+            _AGENT_CARD_CACHE.pop(endpoint.rstrip("/"), None)
+
+    async def _fetch_agent_card(self) -> AgentCard:
+        """Fetch and validate the agent card over HTTP."""
         try:
-            async with self._http_client_context() as client:
-                logger.debug(
-                    "Discovering A2A agent",
-                    endpoint=self.config.endpoint,
-                )
+            client = await self._get_client()
+            logger.debug(
+                "Discovering A2A agent",
+                endpoint=self.config.endpoint,
+            )
 
-                # Fetch agent card
-                response = await client.get(
-                    self._get_url(".well-known/agent-card.json"),
-                    headers=self._build_headers(),
-                )
+            # Fetch agent card
+            response = await client.get(
+                self._discovery_url,
+                headers=self._request_headers,
+            )
 
             # Handle errors
             if response.status_code == 401:
@@ -149,9 +428,17 @@ class A2AClient:
 
             # Parse agent card
             try:
-                agent_card_data = response.json()
-                agent_card = AgentCard(**agent_card_data)
-            except (json.JSONDecodeError, ValueError) as e:
+                agent_card_data = orjson.loads(response.content)
+                if (
+                    self.config.trust_agent_card
+                    and isinstance(agent_card_data, dict)
+                    and "name" in agent_card_data
+                    and "url" in agent_card_data
+                ):
+                    agent_card = AgentCard.from_trusted(agent_card_data)
+                else:
+                    agent_card = AgentCard(**agent_card_data)
+            except ValueError as e:  # Malformed JSON or failed validation
                 logger.error("Failed to parse agent card", error=str(e))
                 msg = f"Invalid agent card format: {e}"
                 raise A2ADiscoveryError(
@@ -159,9 +446,6 @@ class A2AClient:
                     endpoint=self.config.endpoint,
                 ) from e
 
-            # Cache and return
-            self._agent_card = agent_card
-
             logger.info(
                 "Successfully discovered A2A agent",
                 agent_name=agent_card.name,
@@ -191,6 +475,24 @@ class A2AClient:
                 endpoint=self.config.endpoint,
             ) from e
 
+    def _build_rpc_request(
+        self, message_content: str, context_id: str | None
+    ) -> dict[str, Any]:
+        """Build a message/send JSON-RPC request from the class template."""
+        message = {
+            "messageId": token_hex(16),
+            "role": "user",
+            "parts": [{"text": message_content}],
+        }
+        if context_id:
+            message["contextId"] = context_id
+        rpc_request = self._RPC_TEMPLATE.copy()
+        # JSON-RPC allows numeric ids; unique per client is enough for routing
+        self._next_rpc_id += 1
+        rpc_request["id"] = self._next_rpc_id
+        rpc_request["params"] = {"message": message}
+        return rpc_request
+
     async def send_message(
         self,
         message_content: str,
@@ -212,108 +514,96 @@ class A2AClient:
             A2AAuthError: If authentication fails
         """
         # Generate request ID for metrics tracking
-        request_id = str(uuid.uuid4())
+        request_id = token_hex(16)
 
         # Start latency tracking
-        start_time = time.perf_counter()
+        start_ns = time.monotonic_ns()
 
         # Count input tokens
         input_tokens = estimate_tokens(message_content)
 
         # Initialize metrics variables
         status_code = None
+        attempts = 1
         output_tokens = None
         error_msg = None
         response_context_id = None
         response_content = ""
 
         try:
-            async with self._http_client_context() as client:
-                # Build JSON-RPC request
-                rpc_request = {
-                    "jsonrpc": "2.0",
-                    "id": str(uuid.uuid4()),
-                    "method": "message/send",
-                    "params": {
-                        "message": {
-                            "messageId": str(uuid.uuid4()),
-                            "role": "user",
-                            "parts": [{"text": message_content}],
-                            "contextId": context_id,
-                        }
-                    },
-                }
-
-                logger.debug(
-                    "Sending A2A message",
-                    endpoint=self.config.endpoint,
-                    context_id=context_id,
-                    message_length=len(message_content),
-                    input_tokens=input_tokens,
-                )
+            client = await self._get_client()
 
-                # Debug: Log full request payload (only at debug level)
-                logger.trace(
-                    "A2A request payload",
-                    request_id=request_id,
-                    payload=rpc_request,
-                )
+            # Build JSON-RPC request
+            rpc_request = self._build_rpc_request(message_content, context_id)
 
-                # Send request
-                response = await client.post(
-                    self._get_url(), json=rpc_request, headers=self._build_headers()
-                )
+            logger.debug(
+                "Sending A2A message",
+                endpoint=self.config.endpoint,
+                context_id=context_id,
+                message_length=len(message_content),
+                input_tokens=input_tokens,
+            )
 
-            status_code = response.status_code
+            # Debug: Log full request payload (only built at trace level)
+            logger.opt(lazy=True).trace(
+                "A2A request payload",
+                request_id=lambda: request_id,
+                payload=lambda: rpc_request,
+            )
+
+            # Send request
+            status_code, body, attempts = await self._post(
+                client, orjson.dumps(rpc_request)
+            )
 
             # Handle HTTP errors
-            if response.status_code == 401:
+            if status_code == 401:
                 msg = "Authentication failed"
                 raise A2AAuthError(msg)
 
-            if response.status_code == 408:
+            if status_code == 408:
                 msg = "Agent response timeout"
                 raise A2ATimeoutError(
                     msg,
                     timeout=self.config.timeout,
                 )
 
-            if response.status_code >= 400:
-                error_msg = f"Message send failed with status {response.status_code}"
+            if status_code >= 400:
+                error_msg = f"Message send failed with status {status_code}"
                 try:
-                    error_data = response.json()
+                    error_data = orjson.loads(body)
                     # Debug: Log full error response for troubleshooting
                     logger.trace(
                         "A2A error response",
                         request_id=request_id,
-                        status_code=response.status_code,
+                        status_code=status_code,
                         error_data=error_data,
                     )
                     if "error" in error_data:
                         error_msg = f"{error_msg}: {error_data['error']}"
                 except Exception:
                     # Debug: Log raw response text if JSON parsing fails
-                    logger.trace(
+                    logger.opt(lazy=True).trace(
                         "A2A error response (raw)",
-                        request_id=request_id,
-                        status_code=response.status_code,
-                        raw_text=response.text[:1000],  # Limit to 1000 chars
+                        request_id=lambda: request_id,
+                        status_code=lambda: status_code,
+                        raw_text=lambda: _preview(body, 1000),
                     )
 
                 raise A2AError(
                     error_msg,
-                    status_code=response.status_code,
+                    status_code=status_code,
                 )
 
             # Parse JSON-RPC response
             try:
-                rpc_response = response.json()
+                rpc_response = orjson.loads(body)
 
-                # Debug: Log full response payload (only at trace level)
-                logger.trace(
+                # Debug: Log full response payload (only built at trace level)
+                logger.opt(lazy=True).trace(
                     "A2A response payload",
-                    request_id=request_id,
-                    payload=rpc_response,
+                    request_id=lambda: request_id,
+                    payload=lambda: rpc_response,
                 )
 
                 # Check for JSON-RPC error
@@ -327,69 +617,23 @@ class A2AClient:
                 result = rpc_response.get("result", {})
 
                 # Extract response content - handle multiple A2A response formats
-                response_texts = []
-
-                # Format 1: Google ADK style - artifacts array
-                artifacts = result.get("artifacts", [])
-                if artifacts:
-                    for artifact in artifacts:
-                        artifact_parts = artifact.get("parts", [])
-                        for part in artifact_parts:
-                            if "text" in part:
-                                response_texts.append(part["text"])
-
-                # Format 2: Direct Message response - result.parts (per A2A spec)
-                # When server returns a Message (not Task), parts are at result level
-                if not response_texts:
-                    direct_parts = result.get("parts", [])
-                    for part in direct_parts:
-                        if "text" in part:
-                            response_texts.append(part["text"])
-
-                # Format 3: TaskStatusUpdateEvent - status.message.parts (ADK streaming)
-                if not response_texts:
-                    status = result.get("status", {})
-                    status_message = status.get("message", {})
-                    status_parts = status_message.get("parts", [])
-                    for part in status_parts:
-                        if "text" in part:
-                            response_texts.append(part["text"])
-
-                # Format 4: Legacy wrapper format - result.message.parts
-                # Some implementations wrap the message in a 'message' field
-                if not response_texts:
-                    result_message = result.get("message", {})
-                    message_parts = result_message.get("parts", [])
-                    for part in message_parts:
-                        if "text" in part:
-                            response_texts.append(part["text"])
-
-                # Format 5: History-based - last agent message
-                if not response_texts:
-                    history = result.get("history", [])
-                    for msg in reversed(history):
-                        if msg.get("role") == "agent":
-                            msg_parts = msg.get("parts", [])
-                            for part in msg_parts:
-                                if "text" in part:
-                                    response_texts.append(part["text"])
-                            break
+                response_texts = _extract_response_texts(result)
 
                 response_content = "\n".join(response_texts)
 
                 # Debug: Log actual response content
                 if response_content:
-                    logger.debug(
+                    logger.opt(lazy=True).debug(
                         "A2A agent response content",
-                        content_preview=response_content[:500],
-                        content_length=len(response_content),
+                        content_preview=lambda: response_content[:500],
+                        content_length=lambda: len(response_content),
                     )
                 else:
                     logger.warning(
                         "A2A agent returned empty response",
                         request_id=request_id,
                         result_keys=list(result.keys()),
-                        artifacts_count=len(artifacts),
+                        artifacts_count=len(result.get("artifacts", [])),
                     )
 
                 # Count output tokens
@@ -402,7 +646,8 @@ class A2AClient:
                 )
 
                 # Calculate latency
-                latency_ms = (time.perf_counter() - start_time) * 1000
+                latency_ns = time.monotonic_ns() - start_ns
+                latency_ms = latency_ns / 1_000_000
 
                 # Log structured metrics
                 logger.info(
@@ -417,35 +662,37 @@ class A2AClient:
                 )
 
                 # Create and store metrics
-                metrics = ProtocolMetrics(
+                metrics = MetricRow(
                     request_id=request_id,
                     endpoint=self.config.endpoint,
                     method="POST",
                     status_code=status_code,
-                    latency_ms=latency_ms,
+                    latency_ns=latency_ns,
                     input_tokens=input_tokens,
                     output_tokens=output_tokens,
                     context_id=response_context_id,
+                    attempts=attempts,
                 )
-                self._metrics.append(metrics)
+                self._record_metric(metrics)
 
                 return response_content, response_context_id
 
-            except (json.JSONDecodeError, KeyError, TypeError) as e:
+            except (orjson.JSONDecodeError, KeyError, TypeError) as e:
                 error_msg = f"Invalid A2A response format: {e}"
                 # Debug: Log raw response for parsing errors
-                logger.trace(
+                logger.opt(lazy=True).trace(
                     "A2A response parsing failed",
-                    request_id=request_id,
-                    error=str(e),
-                    raw_response=response.text[:2000],  # Limit to 2000 chars
+                    request_id=lambda: request_id,
+                    error=lambda: error_msg,
+                    raw_response=lambda: _preview(body, 2000),
                 )
                 logger.error("Failed to parse A2A response", error=str(e))
                 raise A2AMessageError(error_msg) from e
 
         except httpx.TimeoutException as e:
             # Calculate latency even for timeout
-            latency_ms = (time.perf_counter() - start_time) * 1000
+            latency_ns = time.monotonic_ns() - start_ns
+            latency_ms = latency_ns / 1_000_000
             error_msg = "Agent response timeout"
 
             # Log error with metrics
@@ -459,18 +706,18 @@ class A2AClient:
             )
 
             # Record metrics for timeout
-            metrics = ProtocolMetrics(
+            metrics = MetricRow(
                 request_id=request_id,
                 endpoint=self.config.endpoint,
                 method="POST",
                 status_code=status_code,
-                latency_ms=latency_ms,
+                latency_ns=latency_ns,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
                 context_id=context_id,
                 error=error_msg,
             )
-            self._metrics.append(metrics)
+            self._record_metric(metrics)
 
             raise A2ATimeoutError(
                 error_msg,
@@ -479,7 +726,8 @@ class A2AClient:
 
         except httpx.HTTPError as e:
             # Calculate latency for HTTP errors
-            latency_ms = (time.perf_counter() - start_time) * 1000
+            latency_ns = time.monotonic_ns() - start_ns
+            latency_ms = latency_ns / 1_000_000
             error_msg = f"Failed to send message: {e}"
 
             # Log error with metrics
@@ -494,47 +742,334 @@ class A2AClient:
             )
 
             # Record metrics for HTTP error
-            metrics = ProtocolMetrics(
+            metrics = MetricRow(
                 request_id=request_id,
                 endpoint=self.config.endpoint,
                 method="POST",
                 status_code=status_code or getattr(e, "status_code", None),
-                latency_ms=latency_ms,
+                latency_ns=latency_ns,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
                 context_id=context_id,
                 error=error_msg,
             )
-            self._metrics.append(metrics)
+            self._record_metric(metrics)
 
             raise A2AError(
                 error_msg,
                 status_code=getattr(e, "status_code", None),
             ) from e
 
+    async def send_message_batched(
+        self,
+        message_content: str,
+        context_id: str | None = None,
+    ) -> tuple[str, str]:
+        """
+        Send message to A2A agent, coalescing with other concurrent sends.
+
+        Requests queued within ``config.batch_window_ms`` of each other (up to
+        ``config.max_batch_size``) are posted together as one JSON-RPC 2.0
+        batch array. If the agent rejects batch requests (HTTP 400 or a
+        JSON-RPC "Invalid Request" error), the client falls back to
+        `send_message` for the rest of its lifetime.
+
+        Args:
+            message_content: Text content to send to agent
+            context_id: Optional session context ID for multi-turn conversations
+
+        Returns:
+            Tuple of (response_content, context_id)
+
+        Raises:
+            A2AError: If message sending fails or the client is closed
+            A2ATimeoutError: If request times out
+            A2AAuthError: If authentication fails
+        """
+        if self._batch_supported is False:
+            return await self.send_message(message_content, context_id)
+
+        loop = asyncio.get_running_loop()
+        if self._pending is None or self._batch_loop is not loop:
+            # Queues and tasks are bound to the loop that created them
+            self._pending = asyncio.Queue()
+            self._batch_task = None
+            self._batch_loop = loop
+        if self._batch_task is None or self._batch_task.done():
+            self._batch_task = loop.create_task(self._run_batches(self._pending))
+
+        future: asyncio.Future[tuple[str, str]] = loop.create_future()
+        self._pending.put_nowait((future, message_content, context_id))
+        return await future
+
+    async def _run_batches(self, pending: asyncio.Queue[_PendingSend]) -> None:
+        """Collect queued sends into batches and dispatch each in its own task."""
+        loop = asyncio.get_running_loop()
+        window_s = self.config.batch_window_ms / 1000
+        while True:
+            batch = [await pending.get()]
+            deadline = loop.time() + window_s
+            while len(batch) < self.config.max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(pending.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            # Don't hold up the next batch while this one is in flight
+            task = loop.create_task(self._dispatch_batch_safely(batch))
+            self._inflight.add(task)
+            task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch_batch_safely(self, batch: list[_PendingSend]) -> None:
+        """Dispatch a batch, making sure every caller's future gets resolved."""
+        try:
+            await self._dispatch_batch(batch)
+        except asyncio.CancelledError:
+            msg = "A2A client closed"
+            self._fail_batch(batch, A2AError(msg))
+            raise
+        except A2AError as e:
+            self._fail_batch(batch, e)
+        except Exception as e:
+            logger.error("A2A batch dispatch failed", error=str(e))
+            error = A2AMessageError(f"Invalid A2A batch response: {e}")
+            error.__cause__ = e
+            self._fail_batch(batch, error)
+
+    async def _dispatch_batch(self, batch: list[_PendingSend]) -> None:
+        """Send one batch and resolve each caller's future with its outcome."""
+        if len(batch) == 1 or self._batch_supported is False:
+            await asyncio.gather(
+                *(
+                    self._resolve_single(future, content, context_id)
+                    for future, content, context_id in batch
+                )
+            )
+            return
+
+        rpc_requests = [
+            self._build_rpc_request(content, context_id)
+            for _, content, context_id in batch
+        ]
+        start_ns = time.monotonic_ns()
+        try:
+            client = await self._get_client()
+            status_code, body, attempts = await self._post(
+                client, orjson.dumps(rpc_requests)
+            )
+        except httpx.TimeoutException as e:
+            msg = "Agent response timeout"
+            raise A2ATimeoutError(msg, timeout=self.config.timeout) from e
+        except httpx.HTTPError as e:
+            msg = f"Failed to send message: {e}"
+            raise A2AError(msg) from e
+
+        if status_code == 401:
+            msg = "Authentication failed"
+            raise A2AAuthError(msg)
+
+        try:
+            rpc_responses = orjson.loads(body)
+        except orjson.JSONDecodeError:
+            rpc_responses = None
+
+        if status_code == 400 or _is_invalid_request(rpc_responses):
+            # Agent doesn't speak JSON-RPC batches; remember and resend singly
+            logger.info(
+                "A2A agent does not support batch requests, falling back",
+                endpoint=self.config.endpoint,
+                status_code=status_code,
+            )
+            self._batch_supported = False
+            await self._dispatch_batch(batch)
+            return
+
+        if status_code >= 400:
+            msg = f"Message send failed with status {status_code}"
+            raise A2AError(msg, status_code=status_code)
+
+        if not isinstance(rpc_responses, list):
+            msg = "Invalid A2A batch response: expected a JSON array"
+            raise A2AMessageError(msg)
+
+        self._batch_supported = True
+        latency_ns = time.monotonic_ns() - start_ns
+        by_id = {
+            item.get("id"): item for item in rpc_responses if isinstance(item, dict)
+        }
+        for (future, content, context_id), rpc_request in zip(
+            batch, rpc_requests, strict=True
+        ):
+            rpc_response = by_id.get(rpc_request["id"])
+            result = rpc_response.get("result") if rpc_response is not None else None
+            if rpc_response is None or "error" in rpc_response:
+                error = rpc_response.get("error") if rpc_response is not None else None
+                detail = (
+                    error.get("message", "Unknown error")
+                    if isinstance(error, dict)
+                    else error or "missing from batch response"
+                )
+                error_msg = f"Agent returned error: {detail}"
+            elif not isinstance(result, dict):
+                error_msg = "Invalid A2A response format: result is not an object"
+            else:
+                error_msg = None
+
+            if error_msg is not None:
+                self._record_metric(
+                    MetricRow(
+                        request_id=str(rpc_request["id"]),
+                        endpoint=self.config.endpoint,
+                        method="POST",
+                        status_code=status_code,
+                        latency_ns=latency_ns,
+                        input_tokens=estimate_tokens(content),
+                        context_id=context_id,
+                        error=error_msg,
+                        attempts=attempts,
+                    )
+                )
+                if not future.done():
+                    future.set_exception(A2AMessageError(error_msg))
+                continue
+
+            assert isinstance(result, dict)
+            response_content = "\n".join(_extract_response_texts(result))
+            response_context_id = result.get("contextId") or result.get(
+                "message", {}
+            ).get("contextId")
+            self._record_metric(
+                MetricRow(
+                    request_id=str(rpc_request["id"]),
+                    endpoint=self.config.endpoint,
+                    method="POST",
+                    status_code=status_code,
+                    latency_ns=latency_ns,
+                    input_tokens=estimate_tokens(content),
+                    output_tokens=estimate_tokens(response_content),
+                    context_id=response_context_id,
+                    attempts=attempts,
+                )
+            )
+            if not future.done():
+                future.set_result((response_content, response_context_id))
+
+    async def _resolve_single(
+        self,
+        future: asyncio.Future[tuple[str, str]],
+        content: str,
+        context_id: str | None,
+    ) -> None:
+        """Send one queued message with `send_message` and resolve its future."""
+        try:
+            result = await self.send_message(content, context_id)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        else:
+            if not future.done():
+                future.set_result(result)
+
+    @staticmethod
+    def _fail_batch(batch: list[_PendingSend], error: Exception) -> None:
+        """Fail every pending future in a batch with the same error."""
+        for future, _, _ in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _stop_batching(self) -> None:
+        """Stop the batch collector and fail any sends that are still pending."""
+        # Tasks and futures from another (likely closed) loop can't be
+        # touched from here; they're simply dropped
+        if self._batch_loop is asyncio.get_running_loop():
+            tasks = [*self._inflight]
+            if self._batch_task is not None:
+                tasks.append(self._batch_task)
+            for task in tasks:
+                task.cancel()
+            for task in tasks:
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
+            if self._pending is not None:
+                queued = []
+                while not self._pending.empty():
+                    queued.append(self._pending.get_nowait())
+                self._fail_batch(queued, A2AError("A2A client closed"))
+
+        self._inflight.clear()
+        self._pending = None
+        self._batch_task = None
+        self._batch_loop = None
+
+    def _record_metric(self, row: MetricRow) -> None:
+        """Store a metric row and fold it into the running totals."""
+        if len(self._metrics) == self._metrics.maxlen:
+            # The bounded deque is about to evict its oldest row
+            self._metric_totals.remove(self._metrics[0])
+        self._metrics.append(row)
+        self._metric_totals.add(row)
+
     def get_metrics(self) -> list[ProtocolMetrics]:
         """
         Get all collected protocol metrics.
 
+        Each call validates a new ProtocolMetrics model per recorded request,
+        so call it once and reuse the list; use `get_aggregated_metrics` when
+        only the summary is needed, or `metrics_view` to poll the raw rows.
+
         Returns:
             List of ProtocolMetrics for all requests made by this client
         """
-        return self._metrics.copy()
+        return [row.to_protocol_metrics() for row in self._metrics]
+
+    def metrics_view(self) -> MetricRowsView:
+        """
+        Get a read-only view of the collected metric rows.
+
+        Unlike `get_metrics`, this copies nothing and builds no
+        ProtocolMetrics, so it is cheap to poll.
+
+        Returns:
+            Live, read-only sequence of raw metric rows
+        """
+        return MetricRowsView(self._metrics)
+
+    def get_aggregated_metrics(self) -> AggregatedMetrics:
+        """
+        Get aggregated protocol metrics summary.
+
+        Read from running totals kept as rows are recorded, so this is O(1)
+        and builds no ProtocolMetrics.
+
+        Returns:
+            AggregatedMetrics for all requests made by this client
+        """
+        return AggregatedMetrics.from_totals(self._metric_totals)
 
     def clear_metrics(self) -> None:
         """Clear all collected metrics."""
         self._metrics.clear()
+        self._metric_totals = MetricTotals()
 
-    async def close(self):
+    async def close(self) -> None:
         """Close HTTP client if owned by this instance."""
-        if self._owned_client and self._http_client is not None:
-            await self._http_client.aclose()
-            self._http_client = None
+        await self._stop_batching()
+        if self._owned_client:
+            await self._close_owned_client()
 
-    async def __aenter__(self):
+    async def __aenter__(self) -> "A2AClient":
         """Async context manager entry."""
         return self
 
-    async def __aexit__(self, exc_type, exc_val, exc_tb):
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
         """Async context manager exit."""
         await self.close()
\ No newline at end of file
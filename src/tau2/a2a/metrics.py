@@ -1,8 +1,13 @@
 """Protocol metrics for A2A protocol interactions."""
 
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, overload
 
+import numpy as np
+import numpy.typing as npt
 from pydantic import BaseModel, Field
 
 
@@ -18,6 +23,7 @@ class ProtocolMetrics(BaseModel):
     output_tokens: int | None = None
     context_id: str | None = None
     error: str | None = None
+    attempts: int = 1  # Includes retries of 429/503 responses
     timestamp: str = Field(
         default_factory=lambda: datetime.now(timezone.utc).isoformat()
     )
@@ -27,6 +33,132 @@ class ProtocolMetrics(BaseModel):
         return self.model_dump(exclude_none=True)
 
 
+@dataclass(slots=True)
+class MetricRow:
+    """
+    Lightweight record of one A2A request, as collected on the hot path.
+
+    Mirrors the fields of `ProtocolMetrics` without pydantic validation;
+    rows are inflated into `ProtocolMetrics` only when metrics are read.
+    """
+
+    request_id: str
+    endpoint: str
+    method: str
+    status_code: int | None
+    latency_ns: int
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    context_id: str | None = None
+    error: str | None = None
+    attempts: int = 1
+    # Wall-clock capture time; ISO formatting is deferred to export
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    def to_protocol_metrics(self) -> ProtocolMetrics:
+        """Build the validated `ProtocolMetrics` model for this row."""
+        data = asdict(self)
+        timestamp_ns = data.pop("timestamp_ns")
+        data["timestamp"] = datetime.fromtimestamp(
+            timestamp_ns / 1e9, tz=timezone.utc
+        ).isoformat()
+        data["latency_ms"] = data.pop("latency_ns") / 1_000_000
+        return ProtocolMetrics(**data)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        JSON-serializable dict for export, without building a model.
+
+        Matches ``to_protocol_metrics().to_dict()`` (None fields omitted).
+        """
+        data: dict[str, Any] = {
+            "request_id": self.request_id,
+            "endpoint": self.endpoint,
+            "method": self.method,
+            "status_code": self.status_code,
+            "latency_ms": self.latency_ns / 1_000_000,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "context_id": self.context_id,
+            "error": self.error,
+            "attempts": self.attempts,
+            "timestamp": datetime.fromtimestamp(
+                self.timestamp_ns / 1e9, tz=timezone.utc
+            ).isoformat(),
+        }
+        return {key: value for key, value in data.items() if value is not None}
+
+    @property
+    def latency_ms(self) -> float:
+        """Request latency in milliseconds."""
+        return self.latency_ns / 1_000_000
+
+
+class MetricRowsView(Sequence[MetricRow]):
+    """
+    Read-only, zero-copy view over a client's collected `MetricRow`s.
+
+    Reflects rows recorded after the view was taken; copy it (e.g. with
+    ``list(view)``) to get a snapshot.
+    """
+
+    __slots__ = ("_rows",)
+
+    def __init__(self, rows: Sequence[MetricRow]):
+        self._rows = rows
+
+    @overload
+    def __getitem__(self, index: int) -> MetricRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[MetricRow]: ...
+
+    def __getitem__(self, index: int | slice) -> MetricRow | Sequence[MetricRow]:
+        if isinstance(index, slice):
+            return list(self._rows)[index]
+        return self._rows[index]
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __iter__(self) -> Iterator[MetricRow]:
+        return iter(self._rows)
+
+    def __repr__(self) -> str:
+        return f"MetricRowsView({list(self._rows)!r})"
+
+
+@dataclass(slots=True)
+class MetricTotals:
+    """
+    Running totals over a set of `MetricRow`s.
+
+    Kept up to date as rows are added (and evicted), so aggregation is O(1)
+    instead of a walk over every row.
+    """
+
+    requests: int = 0
+    tokens: int = 0
+    latency_ns: int = 0
+    errors: int = 0
+
+    def add(self, row: MetricRow) -> None:
+        """Include a row in the totals."""
+        self.requests += 1
+        self.tokens += (row.input_tokens or 0) + (row.output_tokens or 0)
+        self.latency_ns += row.latency_ns
+        if row.error is not None:
+            self.errors += 1
+
+    def remove(self, row: MetricRow) -> None:
+        """Take a previously added row back out of the totals."""
+        self.requests -= 1
+        self.tokens -= (row.input_tokens or 0) + (row.output_tokens or 0)
+        self.latency_ns -= row.latency_ns
+        if row.error is not None:
+            self.errors -= 1
+
+
 class AggregatedMetrics(BaseModel):
     """Aggregated metrics computed post-run."""
 
@@ -42,15 +174,18 @@ class AggregatedMetrics(BaseModel):
         cls, metrics: list[ProtocolMetrics]
     ) -> "AggregatedMetrics":
         """Compute aggregated metrics from list of protocol metrics."""
+        total_tokens = 0
+        total_latency_ms = 0.0
+        error_count = 0
+        for m in metrics:
+            total_tokens += (m.input_tokens or 0) + (m.output_tokens or 0)
+            total_latency_ms += m.latency_ms
+            if m.error is not None:
+                error_count += 1
         total_requests = len(metrics)
-        total_tokens = sum(
-            (m.input_tokens or 0) + (m.output_tokens or 0) for m in metrics
-        )
-        total_latency_ms = sum(m.latency_ms for m in metrics)
         avg_latency_ms = (
             total_latency_ms / total_requests if total_requests > 0 else 0.0
         )
-        error_count = sum(1 for m in metrics if m.error is not None)
 
         return cls(
             total_requests=total_requests,
@@ -60,6 +195,30 @@ class AggregatedMetrics(BaseModel):
             error_count=error_count,
         )
 
+    @classmethod
+    def from_rows(cls, rows: Iterable[MetricRow]) -> "AggregatedMetrics":
+        """Compute aggregated metrics directly from raw metric rows."""
+        totals = MetricTotals()
+        for row in rows:
+            totals.add(row)
+        return cls.from_totals(totals)
+
+    @classmethod
+    def from_totals(cls, totals: MetricTotals) -> "AggregatedMetrics":
+        """Build aggregated metrics from precomputed running totals."""
+        total_latency_ms = totals.latency_ns / 1_000_000
+        avg_latency_ms = (
+            total_latency_ms / totals.requests if totals.requests > 0 else 0.0
+        )
+
+        return cls(
+            total_requests=totals.requests,
+            total_tokens=totals.tokens,
+            total_latency_ms=total_latency_ms,
+            avg_latency_ms=avg_latency_ms,
+            error_count=totals.errors,
+        )
+
 
 def estimate_tokens(text: str) -> int:
     """
@@ -75,7 +234,25 @@ def estimate_tokens(text: str) -> int:
     Returns:
         Estimated token count
     """
-    if not text:
-        return 0
     # Simple heuristic: ~4 chars per token
-    return len(text) // 4
+    return len(text) >> 2 if text else 0
+
+
+def estimate_tokens_bulk(texts: Sequence[str | None]) -> npt.NDArray[np.int64]:
+    """
+    Estimate token counts for many texts at once.
+
+    Uses the same ~4 characters per token heuristic as `estimate_tokens`.
+
+    Args:
+        texts: Input texts to estimate tokens for
+
+    Returns:
+        Integer array of estimated token counts, one per input text
+    """
+    lengths = np.fromiter(
+        (len(text) if text else 0 for text in texts),
+        dtype=np.int64,
+        count=len(texts),
+    )
+    return lengths >> 2
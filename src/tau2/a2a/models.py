@@ -6,25 +6,63 @@ from typing import Any
 from pydantic import BaseModel, ConfigDict, Field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class A2AConfig:
-    """Configuration bundle for A2A agent connection and behavior."""
+    """
+    Configuration bundle for A2A agent connection and behavior.
+
+    Instances are immutable and hashable, so they can key caches.
+    """
 
     endpoint: str
     auth_token: str | None = None
     timeout: int = 300
     verify_ssl: bool = True
+    http2: bool = True  # Negotiate HTTP/2; off forces HTTP/1.1
+    max_metrics: int | None = None  # Keep only the most recent N; None = unbounded
+    batch_window_ms: float = 5.0  # Coalescing window for send_message_batched
+    max_batch_size: int = 32
+    agent_card_ttl_s: float = 900.0  # Process-wide agent card cache lifetime
+    trust_agent_card: bool = False  # Skip agent card validation (trusted agents)
+    max_inflight: int = 20  # Concurrent requests on the wire
+    max_retries: int = 3  # Retries for 429/503 responses
 
     def __post_init__(self) -> None:
         """Validate and normalize configuration after initialization."""
-        # Normalize endpoint (remove trailing slash)
-        self.endpoint = self.endpoint.rstrip("/")
+        # Normalize endpoint (remove trailing slash); frozen, so bypass __setattr__
+        object.__setattr__(self, "endpoint", self.endpoint.rstrip("/"))
 
         # Validate timeout
         if self.timeout <= 0:
             msg = f"timeout must be positive, got {self.timeout}"
             raise ValueError(msg)
 
+        # Validate metrics bound
+        if self.max_metrics is not None and self.max_metrics <= 0:
+            msg = f"max_metrics must be positive or None, got {self.max_metrics}"
+            raise ValueError(msg)
+
+        # Validate batching
+        if self.batch_window_ms < 0:
+            msg = f"batch_window_ms must be non-negative, got {self.batch_window_ms}"
+            raise ValueError(msg)
+        if self.max_batch_size <= 0:
+            msg = f"max_batch_size must be positive, got {self.max_batch_size}"
+            raise ValueError(msg)
+
+        # Validate concurrency and retries
+        if self.max_inflight <= 0:
+            msg = f"max_inflight must be positive, got {self.max_inflight}"
+            raise ValueError(msg)
+        if self.max_retries < 0:
+            msg = f"max_retries must be non-negative, got {self.max_retries}"
+            raise ValueError(msg)
+
+        # Validate agent card cache lifetime
+        if self.agent_card_ttl_s < 0:
+            msg = f"agent_card_ttl_s must be non-negative, got {self.agent_card_ttl_s}"
+            raise ValueError(msg)
+
         # Validate URL scheme
         if not self.endpoint.startswith(("http://", "https://")):
             msg = f"endpoint must start with http:// or https://, got {self.endpoint}"
@@ -61,8 +99,36 @@ class AgentCard(BaseModel):
 
     model_config = ConfigDict(use_enum_values=True)
 
-
-@dataclass
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> "AgentCard":
+        """
+        Build an agent card from trusted data without running validation.
+
+        Nested capabilities and skills are constructed the same way, so
+        attribute access works as on a validated card. Only use this for
+        agents whose card is known to match the schema.
+
+        Args:
+            data: Parsed agent card JSON
+
+        Returns:
+            AgentCard built with ``model_construct``
+        """
+        fields = dict(data)
+        capabilities = fields.get("capabilities")
+        if isinstance(capabilities, dict):
+            fields["capabilities"] = AgentCapabilities.model_construct(**capabilities)
+        skills = fields.get("skills")
+        if isinstance(skills, list):
+            fields["skills"] = [
+                AgentSkill.model_construct(**skill)
+                for skill in skills
+                if isinstance(skill, dict)
+            ]
+        return cls.model_construct(**fields)
+
+
+@dataclass(slots=True)
 class A2AAgentState:
     """Agent execution state for single task evaluation."""
 
@@ -1,8 +1,10 @@
 """Message translation utilities between tau2-bench and A2A protocol formats."""
 
-import json
+import functools
 import uuid
+from collections.abc import Callable
 
+import orjson
 from loguru import logger
 
 from tau2.a2a.exceptions import A2AMessageError
@@ -14,11 +16,49 @@ from tau2.data_model.message import (
 )
 from tau2.environment.tool import Tool
 
+# Fixed text wrapped around the tool list, ending with the tool call
+# instructions
+_TOOLS_HEADER = "<available_tools>"
+_TOOLS_FOOTER = (
+    "</available_tools>\n\n"
+    "To use a tool, respond with JSON: "
+    '{"tool_call": {"name": "tool_name", "arguments": {"param1": "value"}}}'
+)
+
+
+class _ToolsKey:
+    """
+    Identity-based cache key for a sequence of tools.
+
+    Tools are unhashable pydantic models, so they are compared by identity.
+    The key holds the tools themselves, which keeps their ids from being
+    reused while the cache entry is alive.
+    """
+
+    __slots__ = ("_hash", "tools")
+
+    def __init__(self, tools: tuple[Tool, ...]):
+        self.tools = tools
+        self._hash = hash(tuple(id(tool) for tool in tools))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, _ToolsKey)
+            and len(self.tools) == len(other.tools)
+            and all(a is b for a, b in zip(self.tools, other.tools, strict=True))
+        )
+
 
 def format_tools_as_text(tools: list[Tool]) -> str:
     """
     Convert tau2 Tools to text description for A2A agent consumption.
 
+    The text for a given list of tool objects is built once and cached, as
+    an agent's tools don't change between turns.
+
     Args:
         tools: List of tau2 Tool objects
 
@@ -29,14 +69,20 @@ def format_tools_as_text(tools: list[Tool]) -> str:
         logger.trace("No tools to format for A2A message")
         return ""
 
-    logger.trace(
+    return _format_tools_cached(_ToolsKey(tuple(tools)))
+
+
+@functools.lru_cache(maxsize=32)
+def _format_tools_cached(key: _ToolsKey) -> str:
+    """Build the tool text for `format_tools_as_text` (cached per tool set)."""
+    tools = key.tools
+    logger.opt(lazy=True).trace(
         "Formatting tools as text for A2A agent",
-        num_tools=len(tools),
-        tool_names=[tool.name for tool in tools],
+        num_tools=lambda: len(tools),
+        tool_names=lambda: [tool.name for tool in tools],
     )
 
-    lines = ["<available_tools>"]
-
+    tool_blocks = []
     for tool in tools:
         # Get OpenAI schema format
         schema = tool.openai_schema
@@ -44,57 +90,115 @@ def format_tools_as_text(tools: list[Tool]) -> str:
         name = func_schema.get("name", tool.name)
         description = func_schema.get("description", "No description available")
         parameters = func_schema.get("parameters", {})
-
-        # Build parameter signature
-        param_parts = []
         properties = parameters.get("properties", {})
-        required = parameters.get("required", [])
+        required = frozenset(parameters.get("required", ()))
 
+        # Signature parts and parameter details in a single pass
+        param_parts = []
+        param_lines = []
         for param_name, param_schema in properties.items():
             param_type = param_schema.get("type", "any")
-            is_required = param_name in required
+            required_str = "required" if param_name in required else "optional"
+            param_desc = param_schema.get("description", "No description")
             param_parts.append(f"{param_name}: {param_type}")
+            param_lines.append(
+                f"    - {param_name} ({param_type}, {required_str}): {param_desc}"
+            )
 
-        # Format tool signature
-        signature = f"{name}({', '.join(param_parts)})"
-        lines.append(f"- {signature}")
-        lines.append(f"  Description: {description}")
-
-        # Add parameter details
-        if properties:
-            lines.append("  Parameters:")
-            for param_name, param_schema in properties.items():
-                param_type = param_schema.get("type", "any")
-                param_desc = param_schema.get("description", "No description")
-                is_required = param_name in required
-                required_str = "required" if is_required else "optional"
-                lines.append(
-                    f"    - {param_name} ({param_type}, {required_str}): {param_desc}"
-                )
-
-        lines.append("")  # Empty line between tools
-
-    lines.append("</available_tools>")
-    lines.append("")
-    lines.append(
-        'To use a tool, respond with JSON: {"tool_call": {"name": "tool_name", "arguments": {"param1": "value"}}}'
-    )
+        # Tool signature and description, then parameter details
+        block = f"- {name}({', '.join(param_parts)})\n  Description: {description}"
+        if param_lines:
+            block += "\n  Parameters:\n" + "\n".join(param_lines)
+
+        # Trailing newline leaves an empty line between tools
+        tool_blocks.append(block + "\n")
 
-    tool_text = "\n".join(lines)
+    tools_body = "\n".join(tool_blocks)
+    tool_text = f"{_TOOLS_HEADER}\n{tools_body}\n{_TOOLS_FOOTER}"
 
     # Debug: Log full tool description sent to A2A agent
-    logger.trace(
+    logger.opt(lazy=True).trace(
         "Tool descriptions formatted for A2A agent",
-        tool_text_length=len(tool_text),
-        tool_text=tool_text,
+        tool_text_length=lambda: len(tool_text),
+        tool_text=lambda: tool_text,
     )
 
     return tool_text
 
 
+def _format_user_message(
+    message: UserMessage, tools: list[Tool] | None, tool_text: str | None
+) -> str:
+    """User messages: include content and optionally tool descriptions."""
+    # Add tool descriptions for user messages (system context)
+    if tool_text is None and tools:
+        logger.debug(
+            "Including tool descriptions in user message",
+            num_tools=len(tools),
+        )
+        tool_text = format_tools_as_text(tools)
+
+    # Tool text goes first: it is identical for every user turn of a task
+    # (and across tasks of a domain), so payloads share a byte-identical
+    # prefix that the remote model's prefix cache can reuse. The variable
+    # user content goes last.
+    if not tool_text:
+        return message.content or ""
+    if message.content:
+        return f"{tool_text}\n\n{message.content}"
+    return tool_text
+
+
+def _format_assistant_message(
+    message: AssistantMessage, _tools: list[Tool] | None, _tool_text: str | None
+) -> str:
+    """Assistant messages: either text content or tool calls."""
+    if message.has_text_content():
+        return message.content or ""
+    if message.is_tool_call() and message.tool_calls:
+        # Convert tool calls to JSON format for A2A
+        tool_calls_data = [
+            {
+                "tool_call": {
+                    "id": tool_call.id,
+                    "name": tool_call.name,
+                    "arguments": tool_call.arguments,
+                }
+            }
+            for tool_call in message.tool_calls
+        ]
+        # Return as JSON string
+        payload = (
+            tool_calls_data[0]
+            if len(tool_calls_data) == 1
+            else {"tool_calls": tool_calls_data}
+        )
+        return orjson.dumps(payload).decode()
+    return ""
+
+
+def _format_tool_message(
+    message: ToolMessage, _tools: list[Tool] | None, _tool_text: str | None
+) -> str:
+    """Tool messages: return the tool output."""
+    prefix = f"Tool result (id={message.id}):"
+    if message.error:
+        return f"{prefix} ERROR: {message.content or 'Unknown error'}"
+    return f"{prefix} {message.content or ''}"
+
+
+# Formatter per exact message class; one dict probe instead of isinstance checks
+_MESSAGE_FORMATTERS: dict[type, Callable[..., str]] = {
+    UserMessage: _format_user_message,
+    AssistantMessage: _format_assistant_message,
+    ToolMessage: _format_tool_message,
+}
+
+
 def tau2_to_a2a_message_content(
     message: UserMessage | AssistantMessage | ToolMessage,
     tools: list[Tool] | None = None,
+    tool_text: str | None = None,
 ) -> str:
     """
     Convert tau2 message to A2A text content.
@@ -102,56 +206,22 @@ def tau2_to_a2a_message_content(
     Args:
         message: tau2 message object
         tools: Optional list of tools to include in user messages
+        tool_text: Optional pre-formatted tool text (from
+            `format_tools_as_text`) to include in user messages; takes
+            precedence over ``tools``
 
     Returns:
         Text content for A2A message
     """
-    if isinstance(message, UserMessage):
-        # User messages: include content and optionally tool descriptions
-        content_parts = []
-        if message.content:
-            content_parts.append(message.content)
-
-        # Add tool descriptions for user messages (system context)
-        if tools:
-            logger.debug(
-                "Including tool descriptions in user message",
-                num_tools=len(tools),
-            )
-            tool_text = format_tools_as_text(tools)
-            if tool_text:
-                content_parts.append("\n" + tool_text)
-
-        return "\n\n".join(content_parts)
-
-    if isinstance(message, AssistantMessage):
-        # Assistant messages: either text content or tool calls
-        if message.has_text_content():
-            return message.content or ""
-        if message.is_tool_call() and message.tool_calls:
-            # Convert tool calls to JSON format for A2A
-            tool_calls_data = []
-            for tool_call in message.tool_calls:
-                tool_calls_data.append(
-                    {
-                        "tool_call": {
-                            "id": tool_call.id,
-                            "name": tool_call.name,
-                            "arguments": tool_call.arguments,
-                        }
-                    }
-                )
-            # Return as JSON string
-            if len(tool_calls_data) == 1:
-                return json.dumps(tool_calls_data[0])
-            return json.dumps({"tool_calls": tool_calls_data})
-        return ""
-
-    # Tool messages: return the tool output
-    prefix = f"Tool result (id={message.id}):"
-    if message.error:
-        return f"{prefix} ERROR: {message.content or 'Unknown error'}"
-    return f"{prefix} {message.content or ''}"
+    formatter = _MESSAGE_FORMATTERS.get(type(message))
+    if formatter is None:
+        # Subclasses miss the exact-type lookup; resolve through the MRO
+        formatter = _MESSAGE_FORMATTERS[ToolMessage]
+        for cls in type(message).__mro__:
+            if cls in _MESSAGE_FORMATTERS:
+                formatter = _MESSAGE_FORMATTERS[cls]
+                break
+    return formatter(message, tools, tool_text)
 
 
 def parse_a2a_tool_calls(content: str) -> list[ToolCall] | None:
@@ -168,18 +238,24 @@ def parse_a2a_tool_calls(content: str) -> list[ToolCall] | None:
     Returns:
         List of ToolCall objects if found, None otherwise
     """
-    if not content or not content.strip():
+    if not content:
+        return None
+    # Both tool call formats are JSON objects; most responses are plain text,
+    # so skip the (exception-raising) parse attempt for them entirely. Only
+    # copy the string when it actually has leading whitespace.
+    first = content.lstrip()[:1] if content[0].isspace() else content[0]
+    if first != "{":
         return None
 
     try:
-        # Try to parse as JSON
-        data = json.loads(content.strip())
+        # Try to parse as JSON (orjson accepts surrounding whitespace)
+        data = orjson.loads(content)
 
         # Handle single tool call format
         if "tool_call" in data:
             tool_data = data["tool_call"]
             tool_call = ToolCall(
-                id=tool_data.get("id", str(uuid.uuid4())),
+                id=tool_data["id"] if "id" in tool_data else uuid.uuid4().hex,
                 name=tool_data["name"],
                 arguments=tool_data["arguments"],
                 requestor="assistant",
@@ -193,7 +269,7 @@ def parse_a2a_tool_calls(content: str) -> list[ToolCall] | None:
                 if "tool_call" in tool_data:
                     tc = tool_data["tool_call"]
                     tool_call = ToolCall(
-                        id=tc.get("id", str(uuid.uuid4())),
+                        id=tc["id"] if "id" in tc else uuid.uuid4().hex,
                         name=tc["name"],
                         arguments=tc["arguments"],
                         requestor="assistant",
@@ -204,7 +280,7 @@ def parse_a2a_tool_calls(content: str) -> list[ToolCall] | None:
         # Not a tool call, just regular content
         return None
 
-    except json.JSONDecodeError:
+    except orjson.JSONDecodeError:
         # Not JSON, treat as regular content
         return None
     except (KeyError, TypeError) as e:
@@ -1,8 +1,13 @@
 """A2A Agent implementation for tau2-bench."""
 
-from typing import Any
+import asyncio
+import threading
+import weakref
+from collections.abc import Coroutine
+from typing import Any, TypeVar
 
 import httpx
+import orjson
 from loguru import logger
 
 from tau2.a2a.client import A2AClient
@@ -10,12 +15,43 @@ from tau2.a2a.metrics import AggregatedMetrics, ProtocolMetrics
 from tau2.a2a.models import A2AAgentState, A2AConfig
 from tau2.a2a.translation import (
     a2a_to_tau2_assistant_message,
+    format_tools_as_text,
     tau2_to_a2a_message_content,
 )
 from tau2.agent.base import LocalAgent, ValidAgentInputMessage
 from tau2.data_model.message import AssistantMessage, Message
 from tau2.environment.tool import Tool
 
+_T = TypeVar("_T")
+
+_TRACE_LEVEL_NO = logger.level("TRACE").no
+
+
+def _trace_enabled() -> bool:
+    """Whether any loguru handler currently accepts TRACE records."""
+    # loguru has no public accessor for the lowest level across handlers
+    min_level: int = logger._core.min_level  # type: ignore[attr-defined]
+    return min_level <= _TRACE_LEVEL_NO
+
+
+def _shutdown_loop(
+    loop: asyncio.AbstractEventLoop, thread: threading.Thread, client: A2AClient
+) -> None:
+    """Close `client` on `loop`, then stop the loop and join its thread."""
+    if threading.current_thread() is thread:
+        # Garbage collection can run the finalizer on the loop's own thread,
+        # which can't wait on itself; stop the loop once the close finishes
+        task = loop.create_task(client.close())
+        task.add_done_callback(lambda _: loop.stop())
+        return
+    try:
+        # Close the HTTP client on the loop its connections belong to
+        asyncio.run_coroutine_threadsafe(client.close(), loop).result()
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
 
 class A2AAgent(LocalAgent):
     """
@@ -48,6 +84,16 @@ class A2AAgent(LocalAgent):
 
         self.config = config
         self.client = A2AClient(config=config, http_client=http_client)
+        # Tools are fixed for the agent's lifetime; format them once
+        self._tool_text = format_tools_as_text(tools)
+        # Persistent event loop (started on first use) that all of the
+        # agent's async work runs on, so the client's connection pool
+        # survives across turns
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: threading.Thread | None = None
+        # Tears the loop down if the agent is dropped without stop(), e.g.
+        # when a simulation step raises
+        self._loop_finalizer: weakref.finalize | None = None
 
         logger.info(
             "Initialized A2AAgent",
@@ -88,39 +134,54 @@ class A2AAgent(LocalAgent):
     ) -> tuple[AssistantMessage, A2AAgentState]:
         """
         Produce the next assistant message by sending the provided input to the remote A2A agent and update the agent state.
-        
+
+        Synchronous wrapper around `agenerate_next_message`, run on the agent's background event loop.
+
         Parameters:
             message: The incoming user or tool-result message to deliver to the remote agent.
             state: The current A2AAgentState (context, conversation history, request count).
-        
+
         Returns:
             A tuple of (AssistantMessage, A2AAgentState) where the AssistantMessage is the agent's reply and the A2AAgentState is the updated state with a possibly new context_id, extended conversation history, and incremented request_count.
         """
-        import asyncio
-
-        # Async/sync bridge: Run async HTTP operations in synchronous context
-        async def _async_generate():
-            # Translate tau2 message to A2A content
-            # Include tools for user messages so agent knows what's available
-            """
-            Send the current tau2 message to the remote A2A agent and return the produced assistant message along with an updated A2AAgentState.
-            
-            The function translates the provided tau2 message into A2A format (including available tools for user messages), sends it to the remote agent via the internal A2A client, translates the agent's A2A response into a tau2 AssistantMessage, and constructs a new state that appends the turn to the conversation history, preserves or updates the context_id returned by the agent, and increments the request count.
-            
-            Returns:
-                tuple[AssistantMessage, A2AAgentState]: The assistant message generated from the A2A response and the updated agent state.
-            """
-            tools_for_translation = self.tools if message.role == "user" else None
-            a2a_content = tau2_to_a2a_message_content(message, tools=tools_for_translation)
-
-            logger.debug(
-                "Sending message to A2A agent",
-                role=message.role,
-                content_length=len(a2a_content),
-                context_id=state.context_id,
-            )
+        return self._run(self.agenerate_next_message(message, state))
+
+    async def agenerate_next_message(
+        self,
+        message: ValidAgentInputMessage,
+        state: A2AAgentState,
+    ) -> tuple[AssistantMessage, A2AAgentState]:
+        """
+        Send the current tau2 message to the remote A2A agent and return the produced assistant message along with an updated A2AAgentState.
+
+        The function translates the provided tau2 message into A2A format (including available tools for user messages), sends it to the remote agent via the internal A2A client, translates the agent's A2A response into a tau2 AssistantMessage, and constructs a new state that appends the turn to the conversation history, preserves or updates the context_id returned by the agent, and increments the request count.
 
-            # Debug: Log context_id lifecycle - before request
+        Async callers can await this directly instead of going through `generate_next_message`; the HTTP client is then bound to the caller's event loop.
+
+        Parameters:
+            message: The incoming user or tool-result message to deliver to the remote agent.
+            state: The current A2AAgentState (context, conversation history, request count).
+
+        Returns:
+            tuple[AssistantMessage, A2AAgentState]: The assistant message generated from the A2A response and the updated agent state.
+        """
+        # Translate tau2 message to A2A content
+        # Include tools for user messages so agent knows what's available
+        tool_text = self._tool_text if message.role == "user" else None
+        a2a_content = tau2_to_a2a_message_content(message, tool_text=tool_text)
+
+        logger.opt(lazy=True).debug(
+            "Sending message to A2A agent",
+            role=lambda: message.role,
+            content_length=lambda: len(a2a_content),
+            context_id=lambda: state.context_id,
+        )
+
+        # Checked once per turn; handlers can be added or removed at runtime
+        trace_enabled = _trace_enabled()
+
+        # Debug: Log context_id lifecycle - before request
+        if trace_enabled:
             if state.context_id is None:
                 logger.trace(
                     "A2A context_id lifecycle: First message, no context yet",
@@ -133,72 +194,84 @@ class A2AAgent(LocalAgent):
                     request_count=state.request_count,
                 )
 
-            # Send message to A2A agent
-            response_content, new_context_id = await self.client.send_message(
-                message_content=a2a_content,
-                context_id=state.context_id,
-            )
+        # Send message to A2A agent
+        response_content, new_context_id = await self.client.send_message(
+            message_content=a2a_content,
+            context_id=state.context_id,
+        )
 
-            logger.debug(
-                "Received response from A2A agent",
-                response_length=len(response_content),
-                new_context_id=new_context_id,
-            )
+        logger.opt(lazy=True).debug(
+            "Received response from A2A agent",
+            response_length=lambda: len(response_content),
+            new_context_id=lambda: new_context_id,
+        )
 
-            # Debug: Log context_id lifecycle - after response
-            if state.context_id is None and new_context_id is not None:
+        # Debug: Log context_id lifecycle - after response
+        if state.context_id is None and new_context_id is not None:
+            if trace_enabled:
                 logger.trace(
                     "A2A context_id lifecycle: New context created by agent",
                     new_context_id=new_context_id,
                     request_count=state.request_count,
                 )
-            elif state.context_id == new_context_id:
+        elif state.context_id == new_context_id:
+            if trace_enabled:
                 logger.trace(
                     "A2A context_id lifecycle: Context persisted across turns",
                     context_id=new_context_id,
                     request_count=state.request_count,
                 )
-            elif state.context_id != new_context_id:
-                logger.warning(
-                    "A2A context_id lifecycle: Context changed unexpectedly",
-                    old_context_id=state.context_id,
-                    new_context_id=new_context_id,
-                    request_count=state.request_count,
-                )
+        elif state.context_id != new_context_id:
+            logger.warning(
+                "A2A context_id lifecycle: Context changed unexpectedly",
+                old_context_id=state.context_id,
+                new_context_id=new_context_id,
+                request_count=state.request_count,
+            )
 
-            # Translate A2A response to tau2 AssistantMessage
-            assistant_msg = a2a_to_tau2_assistant_message(response_content)
+        # Translate A2A response to tau2 AssistantMessage
+        assistant_msg = a2a_to_tau2_assistant_message(response_content)
 
-            # Update state
-            new_conversation_history = state.conversation_history + [
-                message,
-                assistant_msg,
-            ]
+        # Update state; the history is extended in place (as LLMAgent does
+        # with its messages) rather than copied every turn
+        state.conversation_history.extend((message, assistant_msg))
 
-            new_state = A2AAgentState(
-                context_id=new_context_id or state.context_id,
-                conversation_history=new_conversation_history,
-                agent_card=state.agent_card,
-                request_count=state.request_count + 1,
-            )
+        new_state = A2AAgentState(
+            context_id=new_context_id or state.context_id,
+            conversation_history=state.conversation_history,
+            agent_card=state.agent_card,
+            request_count=state.request_count + 1,
+        )
 
-            return assistant_msg, new_state
+        return assistant_msg, new_state
 
-        # Run async function - handle both cases: running in a thread or in an async context
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
+    def _run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """
+        Run a coroutine on the agent's background event loop and wait for it.
+
+        The loop lives in a daemon thread started on first use, so this works
+        the same whether or not the caller is itself inside an event loop.
+        The loop is shut down by `stop()`, or when the agent is garbage
+        collected or the interpreter exits if `stop()` is never reached.
+
+        Args:
+            coro: Coroutine to run
 
-        if loop is None:
-            # No event loop running, create one
-            return asyncio.run(_async_generate())
-        else:
-            # Already in an async context - use nest_asyncio or new thread
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, _async_generate())
-                return future.result()
+        Returns:
+            The coroutine's result
+        """
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = threading.Thread(
+                target=self._loop.run_forever,
+                name="A2AAgent-loop",
+                daemon=True,
+            )
+            self._loop_thread.start()
+            self._loop_finalizer = weakref.finalize(
+                self, _shutdown_loop, self._loop, self._loop_thread, self.client
+            )
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
 
     def stop(
         self,
@@ -208,31 +281,19 @@ class A2AAgent(LocalAgent):
         """
         Stop the agent and release its resources.
         
-        Closes the agent's internal HTTP client by running its asynchronous close routine; the implementation will create or reuse an event loop as needed to perform the shutdown.
+        Closes the agent's internal HTTP client on the agent's background event loop, then stops that loop and joins its thread. Does nothing if the loop was never started. A later call to `generate_next_message` starts a fresh loop.
         
         Parameters:
             message (ValidAgentInputMessage | None): Ignored; present for interface compatibility.
             state (A2AAgentState | None): Ignored; present for interface compatibility.
         """
-        import asyncio
-
-        # Close HTTP client if needed
-        async def _async_close():
-            await self.client.close()
-
-        # Use same event loop handling pattern as generate_next_message
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            loop = None
-
-        if loop is None:
-            asyncio.run(_async_close())
-        else:
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, _async_close())
-                future.result()
+        # Nothing to release if the background loop was never started
+        finalizer = self._loop_finalizer
+        self._loop = None
+        self._loop_thread = None
+        self._loop_finalizer = None
+        if finalizer is not None:
+            finalizer()
 
         logger.debug("A2AAgent stopped and resources cleaned up")
 
@@ -240,6 +301,8 @@ class A2AAgent(LocalAgent):
         """
         Get all collected protocol metrics from the A2A client.
 
+        The models are rebuilt from the client's raw rows on every call.
+
         Returns:
             List of ProtocolMetrics for all A2A requests made by this agent
         """
@@ -252,8 +315,7 @@ class A2AAgent(LocalAgent):
         Returns:
             AggregatedMetrics with computed summary statistics
         """
-        metrics = self.get_protocol_metrics()
-        return AggregatedMetrics.from_protocol_metrics(metrics)
+        return self.client.get_aggregated_metrics()
 
     def export_metrics_json(self, task_id: str | None = None) -> dict[str, Any]:
         """
@@ -268,16 +330,29 @@ class A2AAgent(LocalAgent):
         Returns:
             Dictionary with protocol metrics and summary in tau2-bench format
         """
-        protocol_metrics = self.get_protocol_metrics()
-        aggregated_metrics = self.get_aggregated_metrics()
-
+        # Serialize the raw rows directly; no ProtocolMetrics models are built
         return {
             "task_id": task_id,
             "agent_type": "a2a_agent",
-            "protocol_metrics": [m.to_dict() for m in protocol_metrics],
-            "summary": aggregated_metrics.model_dump(),
+            "protocol_metrics": [row.to_dict() for row in self.client.metrics_view()],
+            "summary": self.get_aggregated_metrics().model_dump(),
         }
 
+    def export_metrics_json_bytes(self, task_id: str | None = None) -> bytes:
+        """
+        Export protocol metrics as encoded JSON.
+
+        Same content as `export_metrics_json`, encoded with orjson for callers
+        that write the export straight to a file or socket.
+
+        Args:
+            task_id: Optional task identifier for context
+
+        Returns:
+            UTF-8 JSON bytes
+        """
+        return orjson.dumps(self.export_metrics_json(task_id))
+
     def clear_metrics(self) -> None:
         """Clear all collected protocol metrics."""
         self.client.clear_metrics()
@@ -295,11 +370,11 @@ class A2AAgent(LocalAgent):
 
         This follows tau2-bench's agent construction pattern where:
         - llm parameter contains the A2A endpoint
-        - llm_args contains auth_token and timeout
+        - llm_args contains auth_token, timeout and http2
 
         Args:
             llm: A2A agent endpoint URL
-            llm_args: Dict with optional 'auth_token' and 'timeout' keys
+            llm_args: Dict with optional 'auth_token', 'timeout' and 'http2' keys
             tools: List of available tools
             domain_policy: Domain policy text
 
@@ -310,6 +385,7 @@ class A2AAgent(LocalAgent):
             endpoint=llm,
             auth_token=llm_args.get("auth_token"),
             timeout=llm_args.get("timeout", 300),
+            http2=llm_args.get("http2", True),
         )
 
         return cls(
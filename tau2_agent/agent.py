@@ -43,6 +43,59 @@ For example, to run an evaluation:
 Be helpful in explaining evaluation metrics and suggesting improvements.
 """
 
+# Text tool call patterns, compiled once; matched against every LLM response
+# Strict: {"tool_call": {"name": "...", "arguments": {...}}} with flat arguments
+_TOOL_CALL_RE_STRICT = re.compile(
+    r'\{\s*"tool_call"\s*:\s*\{[^}]*"name"\s*:\s*"[^"]+"\s*,\s*"arguments"\s*:\s*\{[^}]*\}\s*\}\s*\}',
+    re.DOTALL,
+)
+# Lenient: tolerates nested arguments
+_TOOL_CALL_RE_LENIENT = re.compile(r'\{"tool_call":\s*(\{.*?\})\s*\}', re.DOTALL)
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _decode_tool_call(text: str) -> dict | None:
+    """
+    Find a `{"tool_call": {...}}` object in free text and decode it in one pass.
+
+    Each `"tool_call"` key directly after an opening brace is tried as the
+    start of a JSON object; `raw_decode` parses exactly that object, nested
+    arguments included, and ignores any text after it.
+
+    Returns:
+        The `tool_call` value if it decodes to an object, otherwise None.
+    """
+    key = text.find('"tool_call"')
+    while key != -1:
+        start = text.rfind("{", 0, key)
+        if start != -1 and not text[start + 1 : key].strip():
+            try:
+                parsed, _ = _JSON_DECODER.raw_decode(text, start)
+            except json.JSONDecodeError:
+                pass
+            else:
+                tool_call = parsed.get("tool_call")
+                if isinstance(tool_call, dict):
+                    return tool_call
+        key = text.find('"tool_call"', key + 1)
+    return None
+
+
+def _match_tool_call(text: str) -> dict | None:
+    """Regex fallback for `parse_text_tool_call` when decoding fails."""
+    tool_call_match = _TOOL_CALL_RE_STRICT.search(text)
+    if not tool_call_match:
+        # Try a more lenient pattern for nested arguments
+        tool_call_match = _TOOL_CALL_RE_LENIENT.search(text)
+        if not tool_call_match:
+            return None
+    try:
+        parsed = json.loads(tool_call_match.group(0))
+    except json.JSONDecodeError:
+        return None
+    return parsed.get("tool_call")
+
 
 def create_model():
     """
@@ -91,45 +144,17 @@ def parse_text_tool_call(
             return None
 
     # No native function_call found - try to parse text-based tool call
-    full_text = ""
-    for part in llm_response.content.parts:
-        if part.text:
-            full_text += part.text
+    full_text = "".join(part.text for part in llm_response.content.parts if part.text)
 
-    if not full_text:
+    # Both patterns need the literal key; plain-text answers skip the regexes
+    if '"tool_call"' not in full_text:
         return None
 
-    # Try to find JSON tool_call in the text
-    # Pattern: {"tool_call": {"name": "...", "arguments": {...}}}
-    tool_call_match = re.search(
-        r'\{\s*"tool_call"\s*:\s*\{[^}]*"name"\s*:\s*"[^"]+"\s*,\s*"arguments"\s*:\s*\{[^}]*\}\s*\}\s*\}',
-        full_text,
-        re.DOTALL,
-    )
-
-    if not tool_call_match:
-        # Try a more lenient pattern for nested arguments
-        tool_call_match = re.search(
-            r'\{"tool_call":\s*(\{.*?\})\s*\}',
-            full_text,
-            re.DOTALL,
-        )
-        if tool_call_match:
-            try:
-                # Try to parse the full match
-                inner = tool_call_match.group(0)
-                parsed = json.loads(inner)
-                tool_call = parsed.get("tool_call")
-            except json.JSONDecodeError:
-                return None
-        else:
-            return None
-    else:
-        try:
-            parsed = json.loads(tool_call_match.group(0))
-            tool_call = parsed.get("tool_call")
-        except json.JSONDecodeError:
-            return None
+    # Decode the enclosing JSON object directly; the regexes only cover
+    # output the decoder rejects
+    tool_call = _decode_tool_call(full_text)
+    if tool_call is None:
+        tool_call = _match_tool_call(full_text)
 
     if not tool_call or "name" not in tool_call:
         return None
@@ -4,7 +4,10 @@ GetEvaluationResults tool for ADK agent.
 This tool enables external agents to retrieve completed evaluation results.
 """
 
+import copy
+import functools
 import re
+from pathlib import Path
 from typing import Any
 
 from google.adk.tools import BaseTool
@@ -13,6 +16,51 @@ from google.genai import types
 from loguru import logger
 
 
+@functools.lru_cache(maxsize=128)
+def _summarize_results(results_path: Path, mtime_ns: int) -> dict[str, Any]:  # noqa: ARG001
+    """
+    Load a results file and summarize it.
+
+    Agents tend to fetch the same evaluation repeatedly, and results files
+    can be many MB, so summaries are cached. The file's mtime is part of the
+    key, so a rewritten file is reloaded. Failures are not cached.
+    """
+    from tau2.data_model.simulation import Results
+    from tau2.metrics.agent_metrics import compute_metrics, is_successful
+
+    # Use tau2's Results.load() method
+    results = Results.load(results_path)
+
+    # Use tau2's compute_metrics for analysis
+    metrics = compute_metrics(results)
+
+    # Count successful simulations using tau2's is_successful
+    successful_sims = sum(
+        1
+        for sim in results.simulations
+        if sim.reward_info and is_successful(sim.reward_info.reward)
+    )
+
+    return {
+        "timestamp": results.timestamp,
+        "info": {
+            "num_trials": results.info.num_trials,
+            "max_steps": results.info.max_steps,
+            "agent": results.info.agent_info.implementation,
+            "user": results.info.user_info.implementation,
+        },
+        "summary": {
+            "total_simulations": len(results.simulations),
+            "total_tasks": len(results.tasks),
+            "successful_simulations": successful_sims,
+            "avg_reward": metrics.avg_reward,
+            "pass_hat_k": metrics.pass_hat_ks,
+            "avg_agent_cost": metrics.avg_agent_cost,
+        },
+        "tasks": [{"task_id": task.id} for task in results.tasks],
+    }
+
+
 class GetEvaluationResults(BaseTool):
     """Retrieve results from a completed evaluation"""
 
@@ -23,6 +71,11 @@ class GetEvaluationResults(BaseTool):
         "to see available evaluation files."
     )
 
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # Built on first use; a tool's declaration never changes
+        self._declaration: types.FunctionDeclaration | None = None
+
     def _get_declaration(self) -> types.FunctionDeclaration | None:
         """
         Return a FunctionDeclaration describing this tool's public API.
@@ -30,23 +83,25 @@ class GetEvaluationResults(BaseTool):
         Returns:
             declaration (types.FunctionDeclaration | None): A declaration object containing the tool name, description, and parameter schema, or `None` if the tool should not be exposed.
         """
-        return types.FunctionDeclaration(
-            name=self.name,
-            description=self.description,
-            parameters=types.Schema(
-                type=types.Type.OBJECT,
-                properties={
-                    "evaluation_id": types.Schema(
-                        type=types.Type.STRING,
-                        description="The ID/filename of the evaluation to retrieve (without .json extension)",
-                    ),
-                    "list_available": types.Schema(
-                        type=types.Type.BOOLEAN,
-                        description="If true, list all available evaluation result files",
-                    ),
-                },
-            ),
-        )
+        if self._declaration is None:
+            self._declaration = types.FunctionDeclaration(
+                name=self.name,
+                description=self.description,
+                parameters=types.Schema(
+                    type=types.Type.OBJECT,
+                    properties={
+                        "evaluation_id": types.Schema(
+                            type=types.Type.STRING,
+                            description="The ID/filename of the evaluation to retrieve (without .json extension)",
+                        ),
+                        "list_available": types.Schema(
+                            type=types.Type.BOOLEAN,
+                            description="If true, list all available evaluation result files",
+                        ),
+                    },
+                ),
+            )
+        return self._declaration
 
     async def run_async(
         self, *, args: dict[str, Any], tool_context: ToolContext  # noqa: ARG002
@@ -102,8 +157,6 @@ class GetEvaluationResults(BaseTool):
             - If the simulations directory does not exist, the listing payload will return an empty `available_evaluations`.
             - Any failure during loading or processing returns an error payload and logs the exception.
         """
-        from tau2.data_model.simulation import Results
-        from tau2.metrics.agent_metrics import compute_metrics, is_successful
         from tau2.utils.utils import DATA_DIR
 
         simulations_dir = DATA_DIR / "simulations"
@@ -154,38 +207,11 @@ class GetEvaluationResults(BaseTool):
             }
 
         try:
-            # Use tau2's Results.load() method
-            results = Results.load(results_path)
-
-            # Use tau2's compute_metrics for analysis
-            metrics = compute_metrics(results)
-
-            # Count successful simulations using tau2's is_successful
-            successful_sims = sum(
-                1
-                for sim in results.simulations
-                if sim.reward_info and is_successful(sim.reward_info.reward)
+            summary = _summarize_results(
+                results_path, results_path.stat().st_mtime_ns
             )
-
-            return {
-                "evaluation_id": evaluation_id,
-                "timestamp": results.timestamp,
-                "info": {
-                    "num_trials": results.info.num_trials,
-                    "max_steps": results.info.max_steps,
-                    "agent": results.info.agent_info.implementation,
-                    "user": results.info.user_info.implementation,
-                },
-                "summary": {
-                    "total_simulations": len(results.simulations),
-                    "total_tasks": len(results.tasks),
-                    "successful_simulations": successful_sims,
-                    "avg_reward": metrics.avg_reward,
-                    "pass_hat_k": metrics.pass_hat_ks,
-                    "avg_agent_cost": metrics.avg_agent_cost,
-                },
-                "tasks": [{"task_id": task.id} for task in results.tasks],
-            }
+            # Copy so callers can't alter the cached summary
+            return {"evaluation_id": evaluation_id, **copy.deepcopy(summary)}
 
         except Exception as e:
             logger.error(f"Failed to load evaluation {evaluation_id}: {e}")
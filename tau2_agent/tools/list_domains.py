@@ -4,6 +4,7 @@ ListDomains tool for ADK agent.
 This tool enables external agents to discover available evaluation domains.
 """
 
+import functools
 from typing import Any
 
 from google.adk.tools import BaseTool
@@ -21,6 +22,19 @@ DOMAIN_DESCRIPTIONS = {
 }
 
 
+@functools.cache
+def _count_tasks(domain_name: str) -> int:
+    """
+    Number of tasks in a domain, loaded once per process.
+
+    Task sets are data files that don't change while the server runs, so
+    only the first call pays for loading them. Failures are not cached.
+    """
+    from tau2.run import load_tasks
+
+    return len(load_tasks(domain_name))
+
+
 class ListDomains(BaseTool):
     """List available tau2-bench evaluation domains"""
 
@@ -29,6 +43,11 @@ class ListDomains(BaseTool):
         "List all available tau2-bench evaluation domains and their descriptions"
     )
 
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # Built on first use; a tool's declaration never changes
+        self._declaration: types.FunctionDeclaration | None = None
+
     def _get_declaration(self) -> types.FunctionDeclaration | None:
         """
         Create a FunctionDeclaration describing this tool for integration with GenAI tooling.
@@ -37,14 +56,16 @@ class ListDomains(BaseTool):
             types.FunctionDeclaration | None: A FunctionDeclaration populated with the tool's name, description,
             and an empty object schema for parameters; `None` if no declaration is provided.
         """
-        return types.FunctionDeclaration(
-            name=self.name,
-            description=self.description,
-            parameters=types.Schema(
-                type=types.Type.OBJECT,
-                properties={},
-            ),
-        )
+        if self._declaration is None:
+            self._declaration = types.FunctionDeclaration(
+                name=self.name,
+                description=self.description,
+                parameters=types.Schema(
+                    type=types.Type.OBJECT,
+                    properties={},
+                ),
+            )
+        return self._declaration
 
     async def run_async(
         self, *, args: dict[str, Any], tool_context: ToolContext  # noqa: ARG002
@@ -62,14 +83,12 @@ class ListDomains(BaseTool):
                 - num_tasks (int | None): Number of tasks in the domain, or `None` if tasks could not be loaded (load failures are logged).
         """
         from tau2.registry import registry
-        from tau2.run import load_tasks
 
         domains_info = []
         for domain_name in registry.get_domains():
             try:
-                # Get task count from tau2's task loader
-                tasks = load_tasks(domain_name)
-                num_tasks = len(tasks)
+                # Get task count from tau2's task loader (cached)
+                num_tasks = _count_tasks(domain_name)
             except Exception as e:
                 logger.warning(
                     f"Could not load tasks for domain {domain_name}: {e}"
@@ -6,6 +6,7 @@ This tool enables external agents to request tau2-bench evaluations via A2A prot
 
 import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from google.adk.tools import BaseTool
@@ -13,12 +14,41 @@ from google.adk.tools.tool_context import ToolContext
 from google.genai import types
 from loguru import logger
 
+# Nebius credentials for openai/ provider user LLMs, read once like
+# DEFAULT_USER_LLM below; None when NEBIUS_API_KEY is unset
+_NEBIUS_API_KEY = os.getenv("NEBIUS_API_KEY")
+_NEBIUS_LLM_ARGS = (
+    {
+        "api_key": _NEBIUS_API_KEY,
+        "api_base": os.getenv(
+            "NEBIUS_API_BASE", "https://api.tokenfactory.nebius.com/v1/"
+        ),
+    }
+    if _NEBIUS_API_KEY
+    else None
+)
+
 DEFAULT_USER_LLM = (
     "openai/Qwen/Qwen3-30B-A3B-Thinking-2507"
-    if os.getenv("NEBIUS_API_KEY")
+    if _NEBIUS_LLM_ARGS
     else "gpt-4o"
 )
 
+# Simulations are dominated by waiting on remote LLM / A2A calls, so run
+# several at once; lower it for endpoints with tight rate limits
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Dedicated pool for blocking run_domain calls, so long evaluations don't
+# tie up the event loop's default executor that other ADK code shares.
+# Bounds how many evaluations run at once; further requests queue.
+_EVAL_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tau2-eval")
+
+
+def _task_purpose(task: Any) -> str | None:
+    """A task's stated purpose, or None if it has none."""
+    description = task.description
+    return (description.purpose or None) if description else None
+
 
 class RunTau2Evaluation(BaseTool):
     """Tool to run tau2-bench agent evaluation"""
@@ -34,6 +64,7 @@ class RunTau2Evaluation(BaseTool):
     - num_trials: Number of trials per task (default: 1)
     - num_tasks: Number of tasks to evaluate (default: all tasks in domain)
     - task_ids: Optional list of specific task IDs to run
+    - max_concurrency: Simulations run in parallel (default: {DEFAULT_MAX_CONCURRENCY}); tune to the agent endpoint's rate limits
 
     Returns:
     - status: Evaluation completion status
@@ -42,48 +73,59 @@ class RunTau2Evaluation(BaseTool):
     - tasks: List of evaluated tasks with IDs and names
     """
 
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        # Built on first use; a tool's declaration never changes
+        self._declaration: types.FunctionDeclaration | None = None
+
     def _get_declaration(self) -> types.FunctionDeclaration | None:
         """
         Create the FunctionDeclaration used by the ADK function-calling interface for this tool.
         
         Returns:
-            function_declaration (types.FunctionDeclaration | None): A FunctionDeclaration describing the tool's name, description, and parameter schema (including `domain`, `agent_endpoint`, `user_llm`, `num_trials`, and `num_tasks`), or `None` if a declaration cannot be generated.
+            function_declaration (types.FunctionDeclaration | None): A FunctionDeclaration describing the tool's name, description, and parameter schema (including `domain`, `agent_endpoint`, `user_llm`, `num_trials`, `num_tasks`, and `max_concurrency`), or `None` if a declaration cannot be generated.
         """
-        return types.FunctionDeclaration(
-            name=self.name,
-            description=self.description,
-            parameters=types.Schema(
-                type=types.Type.OBJECT,
-                properties={
-                    "domain": types.Schema(
-                        type=types.Type.STRING,
-                        description="Evaluation domain: airline, retail, telecom, or mock",
-                    ),
-                    "agent_endpoint": types.Schema(
-                        type=types.Type.STRING,
-                        description="A2A endpoint URL of the agent to evaluate",
-                    ),
-                    "user_llm": types.Schema(
-                        type=types.Type.STRING,
-                        description=f"LLM model for user simulator (default: {DEFAULT_USER_LLM})",
-                    ),
-                    "num_trials": types.Schema(
-                        type=types.Type.INTEGER,
-                        description="Number of trials per task (default: 1)",
-                    ),
-                    "num_tasks": types.Schema(
-                        type=types.Type.INTEGER,
-                        description="Number of tasks to evaluate (optional)",
-                    ),
-                    "task_ids": types.Schema(
-                        type=types.Type.ARRAY,
-                        items=types.Schema(type=types.Type.STRING),
-                        description="Optional list of specific task IDs to run",
-                    ),
-                },
-                required=["domain", "agent_endpoint"],
-            ),
-        )
+        if self._declaration is None:
+            self._declaration = types.FunctionDeclaration(
+                name=self.name,
+                description=self.description,
+                parameters=types.Schema(
+                    type=types.Type.OBJECT,
+                    properties={
+                        "domain": types.Schema(
+                            type=types.Type.STRING,
+                            description="Evaluation domain: airline, retail, telecom, or mock",
+                        ),
+                        "agent_endpoint": types.Schema(
+                            type=types.Type.STRING,
+                            description="A2A endpoint URL of the agent to evaluate",
+                        ),
+                        "user_llm": types.Schema(
+                            type=types.Type.STRING,
+                            description=f"LLM model for user simulator (default: {DEFAULT_USER_LLM})",
+                        ),
+                        "num_trials": types.Schema(
+                            type=types.Type.INTEGER,
+                            description="Number of trials per task (default: 1)",
+                        ),
+                        "num_tasks": types.Schema(
+                            type=types.Type.INTEGER,
+                            description="Number of tasks to evaluate (optional)",
+                        ),
+                        "task_ids": types.Schema(
+                            type=types.Type.ARRAY,
+                            items=types.Schema(type=types.Type.STRING),
+                            description="Optional list of specific task IDs to run",
+                        ),
+                        "max_concurrency": types.Schema(
+                            type=types.Type.INTEGER,
+                            description=f"Number of simulations to run in parallel (default: {DEFAULT_MAX_CONCURRENCY}); lower it for rate-limited agent endpoints",
+                        ),
+                    },
+                    required=["domain", "agent_endpoint"],
+                ),
+            )
+        return self._declaration
 
     async def run_async(
         self, *, args: dict[str, Any], tool_context: ToolContext
@@ -99,11 +141,20 @@ class RunTau2Evaluation(BaseTool):
                 - num_trials (int): Number of trials per task (optional, default 1).
                 - num_tasks (int | None): Number of tasks to evaluate (optional).
                 - task_ids (list[str] | None): Specific task IDs to evaluate (optional).
+                - max_concurrency (int): Number of simulations run in parallel (optional, default DEFAULT_MAX_CONCURRENCY).
             tool_context (ToolContext): ADK-provided execution context for the tool.
         
         Returns:
             dict[str, Any]: Structured evaluation result (e.g., status, timestamp, summary, tasks) produced by the execution.
+        
+        Raises:
+            ValueError: If `max_concurrency` is less than 1.
         """
+        max_concurrency = args.get("max_concurrency", DEFAULT_MAX_CONCURRENCY)
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise ValueError(msg)
+
         return await self._execute(
             _tool_context=tool_context,
             domain=args.get("domain"),
@@ -112,6 +163,7 @@ class RunTau2Evaluation(BaseTool):
             num_trials=args.get("num_trials", 1),
             num_tasks=args.get("num_tasks"),
             task_ids=args.get("task_ids"),
+            max_concurrency=max_concurrency,
         )
 
     async def _execute(
@@ -123,6 +175,7 @@ class RunTau2Evaluation(BaseTool):
         num_trials: int = 1,
         num_tasks: int | None = None,
         task_ids: list[str] | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
     ) -> dict[str, Any]:
         """
         Run a tau2-bench evaluation for a given domain and A2A agent endpoint.
@@ -136,6 +189,7 @@ class RunTau2Evaluation(BaseTool):
             num_trials (int): Number of trials to run per task; defaults to 1.
             num_tasks (int | None): Optional number of tasks to evaluate; when None, uses domain defaults.
             task_ids (list[str] | None): Optional explicit list of task IDs to run.
+            max_concurrency (int): Number of simulations run in parallel; tune to the agent endpoint's rate limits.
         
         Returns:
             dict[str, Any]: A result object with keys:
@@ -174,18 +228,14 @@ class RunTau2Evaluation(BaseTool):
                 agent_endpoint=agent_endpoint,
                 user_llm=user_llm,
                 num_trials=num_trials,
+                max_concurrency=max_concurrency,
             )
 
             # Build llm_args_user - pass Nebius credentials for openai/ provider models
+            # (copied, so RunConfig never holds the shared dict)
             llm_args_user = {}
-            nebius_api_key = os.getenv("NEBIUS_API_KEY")
-            if user_llm.startswith("openai/") and nebius_api_key:
-                llm_args_user = {
-                    "api_key": nebius_api_key,
-                    "api_base": os.getenv(
-                        "NEBIUS_API_BASE", "https://api.tokenfactory.nebius.com/v1/"
-                    ),
-                }
+            if _NEBIUS_LLM_ARGS and user_llm.startswith("openai/"):
+                llm_args_user = dict(_NEBIUS_LLM_ARGS)
 
             # Create run configuration
             config = RunConfig(
@@ -202,7 +252,7 @@ class RunTau2Evaluation(BaseTool):
                 max_steps=50,
                 max_errors=10,
                 save_to=None,
-                max_concurrency=1,
+                max_concurrency=max_concurrency,
             )
 
             # Run evaluations in a thread pool to avoid blocking ADK's event loop.
@@ -212,7 +262,7 @@ class RunTau2Evaluation(BaseTool):
             # HTTP requests to the other agent.
             # See: https://github.com/encode/httpx/discussions/2489
             loop = asyncio.get_running_loop()
-            results = await loop.run_in_executor(None, run_domain, config)
+            results = await loop.run_in_executor(_EVAL_EXECUTOR, run_domain, config)
 
             # Use tau2's built-in metrics computation
             metrics = compute_metrics(results)
@@ -244,14 +294,7 @@ class RunTau2Evaluation(BaseTool):
                     "avg_agent_cost": metrics.avg_agent_cost,
                 },
                 "tasks": [
-                    {
-                        "task_id": task.id,
-                        "purpose": (
-                            task.description.purpose
-                            if task.description and task.description.purpose
-                            else None
-                        ),
-                    }
+                    {"task_id": task.id, "purpose": _task_purpose(task)}
                     for task in results.tasks
                 ],
             }
@@ -1,16 +1,21 @@
-from collections.abc import Callable
+from __future__ import annotations
+
 import os
+from typing import TYPE_CHECKING
 
-from dotenv import load_dotenv
 import pytest
+from dotenv import load_dotenv
 
-# Load .env file early so all fixtures and tests have access to env vars
+# Load .env file early so all fixtures and tests have access to env vars.
+# This stays at import time: tau2 reads TAU2_DATA_DIR when it is first
+# imported, which happens while test modules are being collected.
 load_dotenv()
 
-from tau2.data_model.tasks import Task
-from tau2.environment.environment import Environment
-from tau2.registry import registry
-from tau2.run import get_tasks
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from tau2.data_model.tasks import Task
+    from tau2.environment.environment import Environment
 
 
 @pytest.fixture
@@ -20,44 +25,57 @@ def domain_name():
 
 @pytest.fixture
 def get_environment() -> Callable[[], Environment]:
+    from tau2.registry import registry
+
     return registry.get_env_constructor("mock")
 
 
+@pytest.fixture(scope="session")
+def mock_tasks_by_id() -> dict[str, Task]:
+    """All mock domain tasks by id, loaded once per test session."""
+    from tau2.run import get_tasks
+
+    return {task.id: task for task in get_tasks("mock")}
+
+
+def _mock_task(tasks_by_id: dict[str, Task], task_id: str) -> Task:
+    # Deep copy so a test that mutates its task can't affect other tests
+    return tasks_by_id[task_id].model_copy(deep=True)
+
+
 @pytest.fixture
-def base_task() -> Task:
-    return get_tasks("mock", task_ids=["create_task_1"])[0]
+def base_task(mock_tasks_by_id) -> Task:
+    return _mock_task(mock_tasks_by_id, "create_task_1")
 
 
 @pytest.fixture
-def task_with_env_assertions() -> Task:
-    return get_tasks("mock", task_ids=["create_task_1_with_env_assertions"])[0]
+def task_with_env_assertions(mock_tasks_by_id) -> Task:
+    return _mock_task(mock_tasks_by_id, "create_task_1_with_env_assertions")
 
 
 @pytest.fixture
-def task_with_message_history() -> Task:
-    return get_tasks("mock", task_ids=["update_task_with_message_history"])[0]
+def task_with_message_history(mock_tasks_by_id) -> Task:
+    return _mock_task(mock_tasks_by_id, "update_task_with_message_history")
 
 
 @pytest.fixture
-def task_with_initialization_data() -> Task:
-    return get_tasks("mock", task_ids=["update_task_with_initialization_data"])[0]
+def task_with_initialization_data(mock_tasks_by_id) -> Task:
+    return _mock_task(mock_tasks_by_id, "update_task_with_initialization_data")
 
 
 @pytest.fixture
-def task_with_initialization_actions() -> Task:
-    return get_tasks("mock", task_ids=["update_task_with_initialization_actions"])[0]
+def task_with_initialization_actions(mock_tasks_by_id) -> Task:
+    return _mock_task(mock_tasks_by_id, "update_task_with_initialization_actions")
 
 
 @pytest.fixture
-def task_with_history_and_env_assertions() -> Task:
-    return get_tasks("mock", task_ids=["update_task_with_history_and_env_assertions"])[
-        0
-    ]
+def task_with_history_and_env_assertions(mock_tasks_by_id) -> Task:
+    return _mock_task(mock_tasks_by_id, "update_task_with_history_and_env_assertions")
 
 
 @pytest.fixture
-def task_with_action_checks() -> Task:
-    return get_tasks("mock", task_ids=["impossible_task_1"])[0]
+def task_with_action_checks(mock_tasks_by_id) -> Task:
+    return _mock_task(mock_tasks_by_id, "impossible_task_1")
 
 
 # LLM Configuration for Real Integration Tests
@@ -79,9 +97,8 @@ def nebius_llm_config():
     }
 
 
-@pytest.fixture
-def test_llm_agent_config(nebius_llm_config):
-    """Default LLM agent configuration for tests"""
+def _nebius_llm_settings(nebius_llm_config):
+    # Shared by the agent and user simulator fixtures so they can't drift apart
     return {
         "llm": nebius_llm_config["model"],
         "llm_args": {
@@ -92,17 +109,16 @@ def test_llm_agent_config(nebius_llm_config):
     }
 
 
+@pytest.fixture
+def test_llm_agent_config(nebius_llm_config):
+    """Default LLM agent configuration for tests"""
+    return _nebius_llm_settings(nebius_llm_config)
+
+
 @pytest.fixture
 def test_user_llm_config(nebius_llm_config):
     """Default user simulator LLM configuration for tests"""
-    return {
-        "llm": nebius_llm_config["model"],
-        "llm_args": {
-            "api_key": nebius_llm_config["api_key"],
-            "api_base": nebius_llm_config["api_base"],
-            "temperature": 0.0,
-        }
-    }
+    return _nebius_llm_settings(nebius_llm_config)
 
 
 @pytest.fixture
@@ -234,6 +234,16 @@ class MockA2ATransport(httpx.MockTransport):
         return "I understand. How can I help you today?"
 
 
+@pytest.fixture(autouse=True)
+def clear_agent_card_cache():
+    """Keep the process-wide agent card cache from leaking between tests."""
+    from tau2.a2a.client import A2AClient
+
+    A2AClient.invalidate_agent_card()
+    yield
+    A2AClient.invalidate_agent_card()
+
+
 @pytest.fixture
 def mock_a2a_agent():
     """Fixture providing a mock A2A agent transport."""
@@ -358,3 +358,180 @@ def test_a2a_agent_with_message_history(mock_a2a_client, sample_domain_tools):
     # Verify history preserved
     assert len(state.conversation_history) == 2
     assert state.conversation_history[0].content == "Hello"
+
+
+def test_a2a_agent_reuses_connection_pool_across_turns(
+    mock_a2a_agent, sample_domain_tools
+):
+    """Test that the agent's owned HTTP client survives between turns."""
+    import httpx
+
+    from tau2.a2a.models import A2AConfig
+    from tau2.agent.a2a_agent import A2AAgent
+
+    config = A2AConfig(endpoint="http://test-agent.example.com")
+    agent = A2AAgent(
+        config=config,
+        tools=sample_domain_tools,
+        domain_policy="Airline customer service",
+    )
+    # Owned client, but routed to the mock agent
+    agent.client._create_http_client = lambda: httpx.AsyncClient(
+        transport=mock_a2a_agent
+    )
+
+    state = agent.get_init_state()
+    _, state = agent.generate_next_message(
+        UserMessage(role="user", content="Hello"), state
+    )
+    first_client = agent.client._http_client
+    _, state = agent.generate_next_message(
+        UserMessage(role="user", content="Thanks"), state
+    )
+
+    assert agent.client._http_client is first_client
+    assert not first_client.is_closed
+    assert state.request_count == 2
+
+    agent.stop(None, state)
+    assert first_client.is_closed
+    assert agent._loop is None
+
+
+def test_a2a_agent_loop_shut_down_when_dropped_after_error(
+    failing_a2a_agent, sample_domain_tools
+):
+    """Test that a failed turn without stop() doesn't leak the loop thread."""
+    import gc
+
+    import httpx
+
+    from tau2.a2a.exceptions import A2AError
+    from tau2.a2a.models import A2AConfig
+    from tau2.agent.a2a_agent import A2AAgent
+
+    config = A2AConfig(endpoint="http://test-agent.example.com")
+    agent = A2AAgent(
+        config=config,
+        tools=sample_domain_tools,
+        domain_policy="Airline customer service",
+    )
+    agent.client._create_http_client = lambda: httpx.AsyncClient(
+        transport=failing_a2a_agent
+    )
+
+    with pytest.raises(A2AError):
+        agent.generate_next_message(
+            UserMessage(role="user", content="Hello"), agent.get_init_state()
+        )
+    thread = agent._loop_thread
+    http_client = agent.client._http_client
+    assert thread.is_alive()
+
+    # As when Orchestrator.run raises before reaching agent.stop
+    del agent
+    gc.collect()
+
+    assert not thread.is_alive()
+    assert http_client.is_closed
+
+
+def test_a2a_agent_stop_without_loop_starts_no_thread(
+    mock_a2a_client, sample_domain_tools
+):
+    """Test that stopping an agent that never ran doesn't spin up a loop."""
+    from unittest.mock import patch
+
+    from tau2.a2a.models import A2AConfig
+    from tau2.agent.a2a_agent import A2AAgent
+
+    config = A2AConfig(endpoint="http://test-agent.example.com")
+    agent = A2AAgent(
+        config=config,
+        tools=sample_domain_tools,
+        domain_policy="Airline customer service",
+        http_client=mock_a2a_client,
+    )
+
+    with patch.object(A2AAgent, "_run") as mock_run:
+        agent.stop(None, agent.get_init_state())
+
+    mock_run.assert_not_called()
+    assert agent._loop is None
+
+
+@pytest.mark.asyncio
+async def test_a2a_agent_generate_inside_running_loop(
+    mock_a2a_client, sample_domain_tools
+):
+    """Test that the sync API also works when called from async code."""
+    from tau2.a2a.models import A2AConfig
+    from tau2.agent.a2a_agent import A2AAgent
+
+    config = A2AConfig(endpoint="http://test-agent.example.com")
+    agent = A2AAgent(
+        config=config,
+        tools=sample_domain_tools,
+        domain_policy="Airline customer service",
+        http_client=mock_a2a_client,
+    )
+
+    assistant_msg, state = agent.generate_next_message(
+        UserMessage(role="user", content="Hello"), agent.get_init_state()
+    )
+    agent.stop(None, state)
+
+    assert assistant_msg.role == "assistant"
+    assert state.request_count == 1
+
+
+@pytest.mark.asyncio
+async def test_a2a_agent_agenerate_next_message(mock_a2a_client, sample_domain_tools):
+    """Test that async callers can await a turn without the sync bridge."""
+    from tau2.a2a.models import A2AConfig
+    from tau2.agent.a2a_agent import A2AAgent
+
+    config = A2AConfig(endpoint="http://test-agent.example.com")
+    agent = A2AAgent(
+        config=config,
+        tools=sample_domain_tools,
+        domain_policy="Airline customer service",
+        http_client=mock_a2a_client,
+    )
+
+    user_msg = UserMessage(role="user", content="Hello")
+    assistant_msg, state = await agent.agenerate_next_message(
+        user_msg, agent.get_init_state()
+    )
+
+    assert assistant_msg.role == "assistant"
+    assert state.request_count == 1
+    assert state.conversation_history == [user_msg, assistant_msg]
+    # The background loop is only started by the sync wrapper
+    assert agent._loop is None
+
+
+def test_a2a_agent_extends_history_in_place(mock_a2a_client, sample_domain_tools):
+    """Test that each turn appends to the same history list instead of copying."""
+    from tau2.a2a.models import A2AConfig
+    from tau2.agent.a2a_agent import A2AAgent
+
+    config = A2AConfig(endpoint="http://test-agent.example.com")
+    agent = A2AAgent(
+        config=config,
+        tools=sample_domain_tools,
+        domain_policy="Airline customer service",
+        http_client=mock_a2a_client,
+    )
+
+    state = agent.get_init_state()
+    history = state.conversation_history
+    for text in ("Hello", "Thanks"):
+        _, state = agent.generate_next_message(
+            UserMessage(role="user", content=text), state
+        )
+    agent.stop(None, state)
+
+    assert state.conversation_history is history
+    assert len(history) == 4
+    assert [m.role for m in history] == ["user", "assistant", "user", "assistant"]
@@ -156,3 +156,72 @@ def test_discover_agent_with_auth():
 
     # Verify auth token was sent
     assert auth_token_used == "test-token-12345"
+
+
+def test_agent_card_shared_across_clients(mock_a2a_client):
+    """Test that a new client for the same endpoint reuses the cached card."""
+    import asyncio
+
+    from tau2.a2a.client import A2AClient
+
+    config = A2AConfig(endpoint="http://test-agent.example.com")
+
+    async def discover_concurrently():
+        clients = [A2AClient(config, http_client=mock_a2a_client) for _ in range(3)]
+        return await asyncio.gather(*(c.discover_agent() for c in clients))
+
+    cards = asyncio.run(discover_concurrently())
+    later = asyncio.run(
+        A2AClient(config, http_client=mock_a2a_client).discover_agent()
+    )
+
+    assert all(card is cards[0] for card in cards)
+    assert later is cards[0]
+    # Concurrent discoveries coalesce into a single fetch
+    assert mock_a2a_client._transport.request_count == 1
+
+
+def test_agent_card_cache_invalidation_and_ttl(mock_a2a_client):
+    """Test that invalidation and an expired TTL force a refetch."""
+    import asyncio
+
+    from tau2.a2a.client import A2AClient
+
+    config = A2AConfig(endpoint="http://test-agent.example.com")
+    asyncio.run(A2AClient(config, http_client=mock_a2a_client).discover_agent())
+
+    A2AClient.invalidate_agent_card("http://test-agent.example.com/")
+    asyncio.run(A2AClient(config, http_client=mock_a2a_client).discover_agent())
+    assert mock_a2a_client._transport.request_count == 2
+
+    no_cache = A2AConfig(endpoint="http://test-agent.example.com", agent_card_ttl_s=0)
+    asyncio.run(A2AClient(no_cache, http_client=mock_a2a_client).discover_agent())
+    assert mock_a2a_client._transport.request_count == 3
+
+
+def test_trusted_agent_card_matches_validated(mock_a2a_client):
+    """Test that trust_agent_card skips validation but yields the same card."""
+    import asyncio
+
+    from tau2.a2a.client import A2AClient
+
+    validated = asyncio.run(
+        A2AClient(
+            A2AConfig(endpoint="http://test-agent.example.com", agent_card_ttl_s=0),
+            http_client=mock_a2a_client,
+        ).discover_agent()
+    )
+    trusted = asyncio.run(
+        A2AClient(
+            A2AConfig(
+                endpoint="http://test-agent.example.com",
+                agent_card_ttl_s=0,
+                trust_agent_card=True,
+            ),
+            http_client=mock_a2a_client,
+        ).discover_agent()
+    )
+
+    assert trusted == validated
+    assert isinstance(trusted.capabilities, type(validated.capabilities))
+    assert trusted.capabilities.streaming is False
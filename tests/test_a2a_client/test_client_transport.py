@@ -0,0 +1,410 @@
+"""Tests for A2AClient HTTP transport management."""
+
+import asyncio
+import dataclasses
+import json
+
+import httpx
+import pytest
+
+from tau2.a2a.client import A2AClient
+from tau2.a2a.exceptions import A2AError, A2AMessageError
+from tau2.a2a.models import A2AConfig
+
+# Mark all tests in this module as mock-based (no real endpoints)
+pytestmark = pytest.mark.a2a_mock
+
+
+def test_owned_client_reused_within_event_loop():
+    """Test that the owned httpx client is shared by requests on one loop."""
+    client = A2AClient(A2AConfig(endpoint="http://test-agent.example.com"))
+
+    async def get_twice():
+        first = await client._get_client()
+        second = await client._get_client()
+        await client.close()
+        return first, second
+
+    first, second = asyncio.run(get_twice())
+
+    assert first is second
+    assert first.is_closed
+
+
+def test_owned_client_rebuilt_for_new_event_loop():
+    """Test that moving to a new loop closes the old client and builds a new one."""
+    client = A2AClient(A2AConfig(endpoint="http://test-agent.example.com"))
+
+    first = asyncio.run(client._get_client())
+    second = asyncio.run(client._get_client())
+
+    assert first is not second
+    assert first.is_closed
+    assert not second.is_closed
+
+    asyncio.run(client.close())
+    assert second.is_closed
+
+
+def test_injected_client_kept_across_event_loops(mock_a2a_client):
+    """Test that an injected client is never replaced or closed by A2AClient."""
+    config = A2AConfig(endpoint="http://test-agent.example.com")
+    client = A2AClient(config, http_client=mock_a2a_client)
+
+    first = asyncio.run(client._get_client())
+    second = asyncio.run(client._get_client())
+    asyncio.run(client.close())
+
+    assert first is mock_a2a_client
+    assert second is mock_a2a_client
+    assert not mock_a2a_client.is_closed
+
+
+def _capturing_client(captured: list[dict]) -> httpx.AsyncClient:
+    """Build an httpx client that records JSON-RPC request bodies."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        rpc_request = json.loads(request.content)
+        captured.append(rpc_request)
+        return httpx.Response(
+            status_code=200,
+            json={
+                "jsonrpc": "2.0",
+                "id": rpc_request["id"],
+                "result": {
+                    "message": {
+                        "role": "agent",
+                        "parts": [{"text": "ok"}],
+                        "contextId": "ctx-123",
+                    }
+                },
+            },
+        )
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.parametrize("context_id", [None, "ctx-123"])
+def test_send_message_request_body(context_id):
+    """Test the JSON-RPC envelope posted by send_message."""
+    captured: list[dict] = []
+    config = A2AConfig(endpoint="http://test-agent.example.com")
+    client = A2AClient(config, http_client=_capturing_client(captured))
+
+    asyncio.run(client.send_message("Hello", context_id=context_id))
+
+    (body,) = captured
+    assert body["jsonrpc"] == "2.0"
+    assert body["method"] == "message/send"
+    assert isinstance(body["id"], int)
+    message = body["params"]["message"]
+    assert len(message["messageId"]) == 32
+    assert message["role"] == "user"
+    assert message["parts"] == [{"text": "Hello"}]
+    if context_id is None:
+        # contextId is omitted rather than sent as null
+        assert "contextId" not in message
+    else:
+        assert message["contextId"] == context_id
+
+
+def test_max_metrics_keeps_most_recent_rows():
+    """Test that max_metrics bounds the collected metrics to the newest rows."""
+    captured: list[dict] = []
+    config = A2AConfig(endpoint="http://test-agent.example.com", max_metrics=2)
+    client = A2AClient(config, http_client=_capturing_client(captured))
+
+    async def send_three():
+        for i in range(3):
+            await client.send_message(f"Message {i}")
+
+    asyncio.run(send_three())
+
+    metrics = client.get_metrics()
+    assert len(metrics) == 2
+    assert client.get_aggregated_metrics().total_requests == 2
+
+
+@pytest.mark.parametrize("max_metrics", [0, -1])
+def test_max_metrics_must_be_positive(max_metrics):
+    """Test that a non-positive max_metrics is rejected."""
+    with pytest.raises(ValueError, match="max_metrics"):
+        A2AConfig(endpoint="http://test-agent.example.com", max_metrics=max_metrics)
+
+
+def test_config_is_frozen_and_normalized():
+    """Test that A2AConfig strips the endpoint and rejects mutation."""
+    config = A2AConfig(endpoint="http://test-agent.example.com/")
+
+    assert config.endpoint == "http://test-agent.example.com"
+    assert config == A2AConfig(endpoint="http://test-agent.example.com")
+    assert hash(config) == hash(A2AConfig(endpoint="http://test-agent.example.com"))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.timeout = 10
+
+
+def _echo_result(rpc_request: dict) -> dict:
+    """Build a JSON-RPC response echoing the request's message text."""
+    text = rpc_request["params"]["message"]["parts"][0]["text"]
+    return {
+        "jsonrpc": "2.0",
+        "id": rpc_request["id"],
+        "result": {
+            "message": {"role": "agent", "parts": [{"text": f"echo: {text}"}]}
+        },
+    }
+
+
+def _batching_client(posts: list, batch_status: int = 200) -> httpx.AsyncClient:
+    """Build an httpx client whose agent answers batches in reverse order."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        posts.append(body)
+        if isinstance(body, list):
+            if batch_status != 200:
+                return httpx.Response(status_code=batch_status, text="Bad Request")
+            # Reverse so results must be routed by id, not position
+            return httpx.Response(
+                status_code=200, json=[_echo_result(r) for r in reversed(body)]
+            )
+        return httpx.Response(status_code=200, json=_echo_result(body))
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+def _batching_config() -> A2AConfig:
+    return A2AConfig(endpoint="http://test-agent.example.com", batch_window_ms=50)
+
+
+def test_send_message_batched_coalesces_and_routes_by_id():
+    """Test that concurrent sends share one POST and get their own results."""
+    posts: list = []
+    client = A2AClient(_batching_config(), http_client=_batching_client(posts))
+
+    async def send_all():
+        results = await asyncio.gather(
+            *(client.send_message_batched(f"msg {i}") for i in range(3))
+        )
+        await client.close()
+        return results
+
+    results = asyncio.run(send_all())
+
+    assert [content for content, _ in results] == [f"echo: msg {i}" for i in range(3)]
+    assert len(posts) == 1
+    assert isinstance(posts[0], list)
+    assert len(posts[0]) == 3
+    assert len(client.get_metrics()) == 3
+
+
+def test_send_message_batched_falls_back_on_400():
+    """Test that a 400 for a batch switches the client to single requests."""
+    posts: list = []
+    client = A2AClient(
+        _batching_config(), http_client=_batching_client(posts, batch_status=400)
+    )
+
+    async def send_all():
+        results = await asyncio.gather(
+            *(client.send_message_batched(f"msg {i}") for i in range(2))
+        )
+        later = await client.send_message_batched("later")
+        await client.close()
+        return results, later
+
+    results, later = asyncio.run(send_all())
+
+    assert [content for content, _ in results] == ["echo: msg 0", "echo: msg 1"]
+    assert later[0] == "echo: later"
+    assert client._batch_supported is False
+    # One rejected batch, then every message sent on its own
+    assert isinstance(posts[0], list)
+    assert all(isinstance(body, dict) for body in posts[1:])
+    assert len(posts) == 4
+
+
+def test_send_message_batched_keeps_batching_after_server_error():
+    """Test that a 5xx fails the batch without disabling batching."""
+    posts: list = []
+    client = A2AClient(
+        _batching_config(), http_client=_batching_client(posts, batch_status=500)
+    )
+
+    async def send_all():
+        results = await asyncio.gather(
+            *(client.send_message_batched(f"msg {i}") for i in range(2)),
+            return_exceptions=True,
+        )
+        await client.close()
+        return results
+
+    results = asyncio.run(send_all())
+
+    assert all(isinstance(result, A2AError) for result in results)
+    assert client._batch_supported is not False
+
+
+def test_send_message_batched_fails_callers_on_malformed_batch():
+    """Test that a malformed batch response fails callers instead of hanging."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        if isinstance(body, list):
+            return httpx.Response(status_code=200, json=["not", "objects"])
+        return httpx.Response(status_code=200, json=_echo_result(body))
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = A2AClient(_batching_config(), http_client=http_client)
+
+    async def send_all():
+        results = await asyncio.gather(
+            *(client.send_message_batched(f"msg {i}") for i in range(2)),
+            return_exceptions=True,
+        )
+        # The collector must still be alive for later sends
+        later = await client.send_message_batched("later")
+        await client.close()
+        return results, later
+
+    results, later = asyncio.run(asyncio.wait_for(send_all(), timeout=5))
+
+    assert all(isinstance(result, A2AMessageError) for result in results)
+    assert later[0] == "echo: later"
+
+
+def test_close_fails_in_flight_batched_sends():
+    """Test that close() cancels batching and fails pending callers."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.Event().wait()  # Never answers
+        return httpx.Response(status_code=200)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = A2AClient(_batching_config(), http_client=http_client)
+
+    async def send_then_close():
+        sends = [
+            asyncio.create_task(client.send_message_batched(f"msg {i}"))
+            for i in range(2)
+        ]
+        await asyncio.sleep(0.1)  # Let the batch go out
+        await client.close()
+        return await asyncio.gather(*sends, return_exceptions=True)
+
+    results = asyncio.run(asyncio.wait_for(send_then_close(), timeout=5))
+
+    assert all(isinstance(result, A2AError) for result in results)
+    assert "closed" in str(results[0])
+    assert client._batch_task is None
+    assert not client._inflight
+
+
+def test_send_message_reads_large_chunked_response():
+    """Test that a response body spanning many chunks is reassembled and parsed."""
+    text = "x" * 200_000
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        rpc_request = json.loads(request.content)
+        body = json.dumps(
+            {
+                "jsonrpc": "2.0",
+                "id": rpc_request["id"],
+                "result": {"message": {"role": "agent", "parts": [{"text": text}]}},
+            }
+        ).encode()
+
+        async def chunks():
+            for i in range(0, len(body), 10_000):
+                yield body[i : i + 10_000]
+
+        return httpx.Response(status_code=200, content=chunks())
+
+    config = A2AConfig(endpoint="http://test-agent.example.com")
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = A2AClient(config, http_client=http_client)
+
+    content, _ = asyncio.run(client.send_message("Hello"))
+
+    assert content == text
+
+
+def test_send_message_retries_overloaded_agent():
+    """Test that 429/503 responses are retried, honoring Retry-After."""
+    statuses = [429, 503, 200]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = statuses.pop(0)
+        if status != 200:
+            return httpx.Response(status_code=status, headers={"Retry-After": "0"})
+        rpc_request = json.loads(request.content)
+        return httpx.Response(status_code=200, json=_echo_result(rpc_request))
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    client = A2AClient(
+        A2AConfig(endpoint="http://test-agent.example.com"), http_client=http_client
+    )
+
+    content, _ = asyncio.run(client.send_message("Hello"))
+
+    assert content == "echo: Hello"
+    (metrics,) = client.get_metrics()
+    assert metrics.attempts == 3
+
+
+def test_send_message_gives_up_after_max_retries():
+    """Test that retries stop after max_retries and the error is surfaced."""
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(status_code=429, headers={"Retry-After": "0"})
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    config = A2AConfig(endpoint="http://test-agent.example.com", max_retries=1)
+    client = A2AClient(config, http_client=http_client)
+
+    with pytest.raises(A2AError, match="429"):
+        asyncio.run(client.send_message("Hello"))
+    assert len(calls) == 2
+
+
+def test_max_inflight_caps_concurrent_requests():
+    """Test that no more than max_inflight requests are on the wire at once."""
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        rpc_request = json.loads(request.content)
+        return httpx.Response(status_code=200, json=_echo_result(rpc_request))
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    config = A2AConfig(endpoint="http://test-agent.example.com", max_inflight=2)
+    client = A2AClient(config, http_client=http_client)
+
+    async def send_all():
+        return await asyncio.gather(
+            *(client.send_message(f"msg {i}") for i in range(6))
+        )
+
+    results = asyncio.run(send_all())
+
+    assert len(results) == 6
+    assert peak == 2
+
+
+@pytest.mark.parametrize("http2", [True, False])
+def test_owned_client_http2_follows_config(http2):
+    """Test that the owned client negotiates HTTP/2 only when configured to."""
+    config = A2AConfig(endpoint="http://test-agent.example.com", http2=http2)
+    client = A2AClient(config)
+
+    http_client = client._create_http_client()
+
+    assert http_client._transport._pool._http2 is http2
+    asyncio.run(http_client.aclose())
@@ -301,3 +301,80 @@ def test_a2a_debug_flag_integration():
 
     # Verify default is False
     assert config2.a2a_debug is False
+
+
+@pytest.mark.asyncio
+async def test_debug_logging_payloads_built_only_when_enabled(
+    a2a_config, mock_a2a_response
+):
+    """Test that payload log records are evaluated at TRACE and skipped above it."""
+
+    def mock_handler(request: httpx.Request):
+        return httpx.Response(200, json=mock_a2a_response)
+
+    http_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(mock_handler), base_url=a2a_config.endpoint
+    )
+    client = A2AClient(config=a2a_config, http_client=http_client)
+
+    records = []
+    logger.remove()
+    handler_id = logger.add(records.append, level="TRACE")
+    try:
+        await client.send_message("Hello, agent!")
+        logger.remove(handler_id)
+        handler_id = logger.add(records.append, level="INFO")
+        trace_count = len(records)
+        await client.send_message("Hello again!")
+    finally:
+        logger.remove(handler_id)
+        await http_client.aclose()
+
+    payloads = {
+        record.record["message"]: record.record["extra"]
+        for record in records[:trace_count]
+    }
+    request_payload = payloads["A2A request payload"]["payload"]
+    assert request_payload["params"]["message"]["parts"] == [{"text": "Hello, agent!"}]
+    assert payloads["A2A agent response content"]["content_preview"] == (
+        "Hello! I can help you with that."
+    )
+    assert all(
+        record.record["level"].no >= 20 for record in records[trace_count:]
+    )
+
+
+@pytest.mark.parametrize("level", ["TRACE", "INFO"])
+def test_context_lifecycle_traced_only_when_enabled(
+    a2a_config, mock_a2a_response, level
+):
+    """Test that lifecycle trace records follow the configured log level."""
+
+    def mock_handler(request: httpx.Request):
+        return httpx.Response(200, json=mock_a2a_response)
+
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(mock_handler))
+    agent = A2AAgent(
+        config=a2a_config,
+        tools=[],
+        domain_policy="Test policy",
+        http_client=http_client,
+    )
+
+    records = []
+    logger.remove()
+    handler_id = logger.add(records.append, level=level)
+    try:
+        agent.generate_next_message(
+            UserMessage(role="user", content="Hello!"), agent.get_init_state()
+        )
+    finally:
+        logger.remove(handler_id)
+        agent.stop()
+
+    lifecycle = [
+        record
+        for record in records
+        if record.record["message"].startswith("A2A context_id lifecycle")
+    ]
+    assert bool(lifecycle) is (level == "TRACE")
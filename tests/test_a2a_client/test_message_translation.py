@@ -63,6 +63,28 @@ def test_format_tools_as_text_empty():
     assert tool_text == ""
 
 
+def test_format_tools_as_text_cached_per_tool_set(sample_tools):
+    """Test that the same tool objects reuse the formatted text."""
+    first = format_tools_as_text(sample_tools)
+
+    # A new list of the same tools hits the cache; a different set doesn't
+    assert format_tools_as_text(list(sample_tools)) is first
+    subset = format_tools_as_text(sample_tools[:1])
+    assert subset is not first
+    assert "book_flight" not in subset
+
+
+def test_tau2_to_a2a_user_message_with_preformatted_tool_text(sample_tools):
+    """Test that pre-formatted tool text matches formatting the tools inline."""
+    user_msg = UserMessage(role="user", content="Find me a flight.")
+
+    content = tau2_to_a2a_message_content(
+        user_msg, tool_text=format_tools_as_text(sample_tools)
+    )
+
+    assert content == tau2_to_a2a_message_content(user_msg, tools=sample_tools)
+
+
 def test_tau2_to_a2a_user_message(sample_tools):
     """Test converting tau2 UserMessage to A2A content."""
     user_msg = UserMessage(
@@ -78,6 +100,9 @@ def test_tau2_to_a2a_user_message(sample_tools):
     assert "<available_tools>" in content
     assert "search_flights" in content
     assert "book_flight" in content
+    # Stable tool text first, variable user content last
+    assert content.startswith(format_tools_as_text(sample_tools))
+    assert content.endswith(user_msg.content)
 
 
 def test_tau2_to_a2a_user_message_without_tools():
@@ -135,6 +160,27 @@ def test_tau2_to_a2a_assistant_message_tool_call():
     assert parsed["tool_call"]["arguments"]["origin"] == "SFO"
 
 
+def test_tau2_to_a2a_assistant_message_multiple_tool_calls():
+    """Test converting tau2 AssistantMessage with several tool calls."""
+    from tau2.data_model.message import ToolCall
+
+    tool_calls = [
+        ToolCall(id=f"call_{i}", name="get_flight", arguments={"n": i})
+        for i in range(2)
+    ]
+    assistant_msg = AssistantMessage(
+        role="assistant", content=None, tool_calls=tool_calls
+    )
+
+    parsed = json.loads(tau2_to_a2a_message_content(assistant_msg))
+
+    assert [tc["tool_call"]["id"] for tc in parsed["tool_calls"]] == [
+        "call_0",
+        "call_1",
+    ]
+    assert parsed["tool_calls"][1]["tool_call"]["arguments"] == {"n": 1}
+
+
 def test_tau2_to_a2a_tool_message():
     """Test converting tau2 ToolMessage to A2A content."""
     tool_msg = ToolMessage(
@@ -170,6 +216,17 @@ def test_tau2_to_a2a_tool_message_error():
     assert "Flight not found" in content
 
 
+def test_tau2_to_a2a_message_subclass_uses_base_formatter():
+    """Test that message subclasses are formatted like their base class."""
+
+    class CustomUserMessage(UserMessage):
+        pass
+
+    message = CustomUserMessage(role="user", content="Hello")
+
+    assert tau2_to_a2a_message_content(message) == "Hello"
+
+
 def test_parse_a2a_tool_calls_single():
     """Test parsing single tool call from A2A response."""
     a2a_content = json.dumps(
@@ -233,6 +290,22 @@ def test_parse_a2a_tool_calls_not_json():
     assert tool_calls is None
 
 
+def test_parse_a2a_tool_calls_surrounding_whitespace():
+    """Test that whitespace around a JSON tool call is ignored."""
+    a2a_content = '\n  {"tool_call": {"name": "get_user", "arguments": {}}}\n'
+
+    tool_calls = parse_a2a_tool_calls(a2a_content)
+
+    assert tool_calls is not None
+    assert tool_calls[0].name == "get_user"
+
+
+def test_parse_a2a_tool_calls_json_non_object():
+    """Test that JSON that isn't an object is treated as regular content."""
+    assert parse_a2a_tool_calls('"tool_call"') is None
+    assert parse_a2a_tool_calls('[{"tool_call": {}}]') is None
+
+
 def test_parse_a2a_tool_calls_empty():
     """Test parsing empty content."""
     tool_calls = parse_a2a_tool_calls("")
@@ -1,12 +1,13 @@
 """Unit tests for A2A protocol metrics collection."""
 
+import json
 import time
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
 from tau2.a2a.client import A2AClient
-from tau2.a2a.metrics import ProtocolMetrics, estimate_tokens
+from tau2.a2a.metrics import ProtocolMetrics, estimate_tokens, estimate_tokens_bulk
 from tau2.a2a.models import A2AConfig
 
 
@@ -108,6 +109,12 @@ class TestTokenEstimation:
         # Message is ~128 chars → ~32 tokens
         assert 30 <= tokens <= 35
 
+    def test_estimate_tokens_bulk_matches_scalar(self):
+        """Test bulk estimation agrees with per-text estimation."""
+        texts = ["This is a test message", "", None, "a" * 1000]
+        tokens = estimate_tokens_bulk(texts)
+        assert tokens.tolist() == [estimate_tokens(t) for t in texts]
+
 
 @pytest.mark.asyncio
 class TestMetricsCollectionInClient:
@@ -207,9 +214,7 @@ def mock_httpx_client():
     import httpx
 
     # Create mock response
-    mock_response = Mock(spec=httpx.Response)
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
+    response_data = {
         "jsonrpc": "2.0",
         "id": "test-id",
         "result": {
@@ -223,12 +228,11 @@ def mock_httpx_client():
     }
 
     # Create mock client
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_client.post.return_value = mock_response
-    mock_client.get.return_value = mock_response
-    mock_client.aclose.return_value = None
-
-    return mock_client
+    return httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda _request: httpx.Response(status_code=200, json=response_data)
+        )
+    )
 
 
 @pytest.fixture
@@ -237,9 +241,7 @@ def mock_httpx_error_client():
     import httpx
 
     # Create mock error response
-    mock_response = Mock(spec=httpx.Response)
-    mock_response.status_code = 500
-    mock_response.json.return_value = {
+    response_data = {
         "jsonrpc": "2.0",
         "id": "test-id",
         "error": {
@@ -249,7 +251,8 @@ def mock_httpx_error_client():
     }
 
     # Create mock client
-    mock_client = AsyncMock(spec=httpx.AsyncClient)
-    mock_client.post.return_value = mock_response
-
-    return mock_client
+    return httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda _request: httpx.Response(status_code=500, json=response_data)
+        )
+    )
@@ -4,9 +4,10 @@ import json
 from pathlib import Path
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
 
-from tau2.a2a.metrics import AggregatedMetrics, ProtocolMetrics
+from tau2.a2a.metrics import AggregatedMetrics, MetricRow, ProtocolMetrics
 from tau2.a2a.models import A2AConfig
 from tau2.agent.a2a_agent import A2AAgent
 from tau2.data_model.message import UserMessage
@@ -111,6 +112,35 @@ class TestMetricsExport:
         assert aggregated.avg_latency_ms == pytest.approx(350.0 / 3, rel=0.01)
         assert aggregated.error_count == 1
 
+    def test_aggregated_metrics_from_rows_matches_models(self):
+        """Test that aggregating raw rows matches aggregating ProtocolMetrics."""
+        rows = [
+            MetricRow(
+                request_id="req-1",
+                endpoint="http://localhost:8080",
+                method="POST",
+                status_code=200,
+                latency_ns=100_000_000,
+                input_tokens=50,
+                output_tokens=30,
+            ),
+            MetricRow(
+                request_id="req-2",
+                endpoint="http://localhost:8080",
+                method="POST",
+                status_code=None,
+                latency_ns=50_000_000,
+                error="Timeout",
+            ),
+        ]
+
+        from_rows = AggregatedMetrics.from_rows(rows)
+        from_models = AggregatedMetrics.from_protocol_metrics(
+            [row.to_protocol_metrics() for row in rows]
+        )
+
+        assert from_rows == from_models
+
     def test_metrics_list_json_export(self):
         """Test exporting a list of metrics to JSON."""
         metrics_list = [
@@ -344,13 +374,11 @@ def mock_a2a_agent_with_metrics():
         },
     }
 
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = mock_response_data
-
-    mock_client = AsyncMock()
-    mock_client.post.return_value = mock_response
-    mock_client.aclose.return_value = None
+    mock_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda _request: httpx.Response(status_code=200, json=mock_response_data)
+        )
+    )
 
     # Create agent with mock client
     agent = A2AAgent(
@@ -379,3 +407,93 @@ def sample_protocol_metrics():
         )
         for i in range(5)
     ]
+
+
+def test_running_totals_track_evicted_and_cleared_rows():
+    """Test that client running totals match a full re-aggregation."""
+    from tau2.a2a.client import A2AClient
+
+    client = A2AClient(A2AConfig(endpoint="http://localhost:8080", max_metrics=3))
+    for i in range(5):
+        client._record_metric(
+            MetricRow(
+                request_id=f"req-{i}",
+                endpoint="http://localhost:8080",
+                method="POST",
+                status_code=200,
+                latency_ns=(i + 1) * 1_000_000,
+                input_tokens=i,
+                output_tokens=1,
+                error="boom" if i % 2 else None,
+            )
+        )
+
+    assert client.get_aggregated_metrics() == AggregatedMetrics.from_rows(
+        client.metrics_view()
+    )
+    assert client.get_aggregated_metrics().total_requests == 3
+
+    client.clear_metrics()
+    assert client.get_aggregated_metrics().total_requests == 0
+
+
+def test_metrics_view_is_live_and_read_only():
+    """Test that metrics_view reflects new rows without copying them."""
+    from tau2.a2a.client import A2AClient
+
+    client = A2AClient(A2AConfig(endpoint="http://localhost:8080"))
+    view = client.metrics_view()
+    assert len(view) == 0
+
+    row = MetricRow(
+        request_id="req-1",
+        endpoint="http://localhost:8080",
+        method="POST",
+        status_code=200,
+        latency_ns=1_000_000,
+    )
+    client._record_metric(row)
+
+    assert len(view) == 1
+    assert view[0] is row
+    assert view[-1:] == [row]
+    assert not hasattr(view, "append")
+
+
+@pytest.mark.parametrize("error", [None, "boom"])
+def test_metric_row_to_dict_matches_model(error):
+    """Test that rows export the same dict as their ProtocolMetrics model."""
+    row = MetricRow(
+        request_id="req-1",
+        endpoint="http://localhost:8080",
+        method="POST",
+        status_code=None if error else 200,
+        latency_ns=1_234_567,
+        input_tokens=10,
+        context_id=None if error else "ctx-1",
+        error=error,
+    )
+
+    assert row.to_dict() == row.to_protocol_metrics().to_dict()
+
+
+def test_export_metrics_json_bytes_matches_dict_export():
+    """Test that the encoded export decodes to the dict export."""
+    agent = A2AAgent(
+        config=A2AConfig(endpoint="http://localhost:8080"),
+        tools=[],
+        domain_policy="Test policy",
+    )
+    agent.client._record_metric(
+        MetricRow(
+            request_id="req-1",
+            endpoint="http://localhost:8080",
+            method="POST",
+            status_code=200,
+            latency_ns=1_000_000,
+        )
+    )
+
+    exported = agent.export_metrics_json_bytes(task_id="task-1")
+
+    assert json.loads(exported) == agent.export_metrics_json(task_id="task-1")
@@ -7,9 +7,11 @@ Goal: <10% overhead vs baseline (per plan.md performance goals).
 Run with: pytest tests/test_a2a_client/test_performance.py -v
 """
 
+import json
 import time
 from unittest.mock import AsyncMock, Mock, patch
 
+import httpx
 import pytest
 
 from tau2.a2a.models import A2AAgentState, A2AConfig
@@ -168,9 +170,7 @@ async def test_a2a_full_request_cycle_overhead(mock_a2a_agent, sample_tools):
     from tau2.a2a.models import A2AConfig
 
     # Mock HTTP response
-    mock_response = Mock()
-    mock_response.status_code = 200
-    mock_response.json.return_value = {
+    response_data = {
         "jsonrpc": "2.0",
         "result": {
             "message": {
@@ -185,9 +185,12 @@ async def test_a2a_full_request_cycle_overhead(mock_a2a_agent, sample_tools):
 
     config = A2AConfig(endpoint="http://localhost:8080", timeout=300)
 
-    # Create async mock client
-    mock_client = AsyncMock()
-    mock_client.post.return_value = mock_response
+    # Create mock HTTP client
+    mock_client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda _request: httpx.Response(status_code=200, json=response_data)
+        )
+    )
 
     # Create client with mock
     client = A2AClient(config=config, http_client=mock_client)
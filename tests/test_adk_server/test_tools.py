@@ -10,7 +10,10 @@ import pytest
 
 from tau2_agent.tools.get_evaluation_results import GetEvaluationResults
 from tau2_agent.tools.list_domains import ListDomains
-from tau2_agent.tools.run_tau2_evaluation import RunTau2Evaluation
+from tau2_agent.tools.run_tau2_evaluation import (
+    DEFAULT_MAX_CONCURRENCY,
+    RunTau2Evaluation,
+)
 
 # Mark all tests in this module as mock-based (no real endpoints)
 pytestmark = pytest.mark.a2a_mock
@@ -52,6 +55,27 @@ async def test_list_domains_tool(mock_tool_context):
         assert "num_tasks" in domain, "Domain should have num_tasks"
 
 
+@pytest.mark.asyncio
+async def test_list_domains_loads_tasks_once(mock_tool_context):
+    """Test ListDomains caches task counts across calls"""
+    from tau2_agent.tools.list_domains import _count_tasks
+
+    tool = ListDomains(
+        name="list_domains",
+        description="List all available tau2-bench evaluation domains",
+    )
+
+    _count_tasks.cache_clear()
+    with patch("tau2.run.load_tasks", return_value=[Mock(), Mock()]) as load:
+        first = await tool.run_async(args={}, tool_context=mock_tool_context)
+        second = await tool.run_async(args={}, tool_context=mock_tool_context)
+    _count_tasks.cache_clear()
+
+    assert first == second
+    assert all(d["num_tasks"] == 2 for d in first["domains"])
+    assert load.call_count == len(first["domains"])
+
+
 @pytest.mark.asyncio
 async def test_run_tau2_evaluation_tool_success(mock_tool_context):
     """Test RunTau2Evaluation tool with successful evaluation"""
@@ -109,6 +133,47 @@ async def test_run_tau2_evaluation_tool_success(mock_tool_context):
     assert "summary" in result, "Should include summary"
     assert result["summary"]["successful_simulations"] == 10, "All simulations should succeed"
     assert result["summary"]["total_simulations"] == 10, "Should have 10 simulations"
+    assert result["tasks"] == [{"task_id": "task-1", "purpose": "Test purpose"}]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("args", "expected"),
+    [
+        ({}, DEFAULT_MAX_CONCURRENCY),
+        ({"max_concurrency": 3}, 3),
+        ({"max_concurrency": 0}, None),  # rejected
+    ],
+)
+async def test_run_tau2_evaluation_forwards_max_concurrency(
+    mock_tool_context, args, expected
+):
+    """Test RunTau2Evaluation passes max_concurrency through to RunConfig"""
+    tool = RunTau2Evaluation(
+        name="run_tau2_evaluation", description="Run tau2-bench evaluation"
+    )
+    mock_results = Mock(simulations=[], tasks=[], timestamp="2025-11-24T10:00:00Z")
+    mock_metrics = Mock(avg_reward=0.0, pass_hat_ks={}, avg_agent_cost=0.0)
+    evaluation = tool.run_async(
+        args={
+            "domain": "airline",
+            "agent_endpoint": "https://agent.example.com",
+            **args,
+        },
+        tool_context=mock_tool_context,
+    )
+
+    with patch("tau2.run.run_domain", return_value=mock_results) as run_domain, \
+         patch("tau2.metrics.agent_metrics.compute_metrics", return_value=mock_metrics):
+        if expected is None:
+            with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+                await evaluation
+            run_domain.assert_not_called()
+            return
+        await evaluation
+
+    (config,) = run_domain.call_args.args
+    assert config.max_concurrency == expected
 
 
 @pytest.mark.asyncio
@@ -145,3 +210,55 @@ async def test_get_evaluation_results_tool(mock_tool_context):
     assert "error" in result or "message" in result, (
         "GetEvaluationResults should return error/message"
     )
+
+
+@pytest.mark.asyncio
+async def test_get_evaluation_results_cached_until_file_changes(
+    mock_tool_context, tmp_path
+):
+    """Test GetEvaluationResults reloads a results file only when it changes"""
+    import os
+
+    from tau2_agent.tools.get_evaluation_results import _summarize_results
+
+    tool = GetEvaluationResults(
+        name="get_evaluation_results", description="Get evaluation results"
+    )
+    simulations_dir = tmp_path / "simulations"
+    simulations_dir.mkdir()
+    results_path = simulations_dir / "eval-123.json"
+    results_path.write_text("{}")
+
+    results = Mock()
+    results.simulations = []
+    results.tasks = [Mock(id="task-1")]
+    metrics = Mock(avg_reward=1.0, pass_hat_ks={1: 1.0}, avg_agent_cost=0.0)
+
+    _summarize_results.cache_clear()
+    with patch("tau2.utils.utils.DATA_DIR", tmp_path), \
+         patch("tau2.data_model.simulation.Results.load", return_value=results) as load, \
+         patch("tau2.metrics.agent_metrics.compute_metrics", return_value=metrics):
+        args = {"evaluation_id": "eval-123"}
+        first = await tool.run_async(args=args, tool_context=mock_tool_context)
+        first["tasks"].clear()  # Callers get their own copy
+        second = await tool.run_async(args=args, tool_context=mock_tool_context)
+        assert load.call_count == 1
+
+        stat = results_path.stat()
+        os.utime(results_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        await tool.run_async(args=args, tool_context=mock_tool_context)
+        assert load.call_count == 2
+    _summarize_results.cache_clear()
+
+    assert second["evaluation_id"] == "eval-123"
+    assert second["tasks"] == [{"task_id": "task-1"}]
+
+
+@pytest.mark.parametrize(
+    "tool_class", [ListDomains, RunTau2Evaluation, GetEvaluationResults]
+)
+def test_tool_declaration_built_once(tool_class):
+    """Test each tool builds its FunctionDeclaration once and reuses it"""
+    tool = tool_class(name="tool", description="A tool")
+
+    assert tool._get_declaration() is tool._get_declaration()
@@ -0,0 +1,40 @@
+"""
+Tests for the platform simulation script's command-line parsing.
+"""
+
+import importlib.util
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+SCRIPT_PATH = (
+    Path(__file__).parent.parent
+    / "specs"
+    / "001-a2a-integration"
+    / "scripts"
+    / "platform_simulation.py"
+)
+
+
+@pytest.fixture(scope="module")
+def platform_simulation():
+    spec = importlib.util.spec_from_file_location("platform_simulation", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.mark.parametrize("value", ["0", "-1"])
+def test_max_concurrent_rejects_values_below_one(platform_simulation, value):
+    """--max-concurrent below 1 is rejected by argparse instead of hanging the run."""
+    argv = ["platform_simulation.py", "--max-concurrent", value]
+    with (
+        patch("sys.argv", argv),
+        patch.object(platform_simulation.asyncio, "run") as mock_run,
+        pytest.raises(SystemExit) as exc_info,
+    ):
+        platform_simulation.main()
+
+    assert exc_info.value.code == 2
+    mock_run.assert_not_called()